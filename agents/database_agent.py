@@ -5,55 +5,177 @@ Handles all database operations including query generation, execution,
 and result formatting. Ensures SQL safety and data integrity.
 """
 
-from typing import Dict, Any, List, Optional
+import re
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Literal, Mapping, Optional
 from datetime import datetime, timedelta
+from database.cache import TTLCache, make_cache_key
 from database.db_manager import db_manager
 
 
+# Intent fields that fully determine the result of a read query
+CACHE_KEY_FIELDS = (
+    "intent",
+    "entities",
+    "filter_criteria",
+    "aggregation_type",
+    "group_by_field",
+    "original_query",
+)
+
+# Intent names the database agent can route
+IntentName = Literal[
+    "aggregate_query",
+    "filtered_query",
+    "status_query",
+    "group_by_query",
+    "financial_query",
+    "maintenance_query",
+    "dashboard_query",
+    "insert",
+    "update",
+    "delete",
+]
+
+# Keyword tests used to pick a query variant from the original user query
+_DEPRECIATION_RE = re.compile(r"depreciation", re.IGNORECASE)
+_MAINTENANCE_DUE_RE = re.compile(r"due|upcoming", re.IGNORECASE)
+
+# Static (read-only) responses for write intents that are not supported yet
+INSERT_REQUIRES_INFO = MappingProxyType({
+    "success": False,
+    "error": "Insert operation requires more detailed information",
+    "data": None,
+    "message": "Please provide: equipment name, category, department, and purchase price"
+})
+UPDATE_NOT_IMPLEMENTED = MappingProxyType({
+    "success": False,
+    "error": "Update operation not yet implemented",
+    "data": None
+})
+DELETE_REQUIRES_CONFIRMATION = MappingProxyType({
+    "success": False,
+    "error": "Delete operation requires confirmation",
+    "data": None
+})
+
+# Result cache keyed by intent signature and database write version
+_result_cache = TTLCache(maxsize=512, ttl=60)
+
+# Coarser cache keyed by the resolved SQL, its parameters and the database
+# write version, shared by differently-phrased aggregate and group-by queries
+_query_cache = TTLCache(maxsize=512, ttl=60)
+
+
+def _read_only(value: Any) -> Any:
+    """Return a read-only view of a result so cached entries cannot be mutated.
+    
+    Dicts become MappingProxyType and lists become tuples, recursively.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
 class DatabaseAgent:
     """Agent responsible for database operations."""
     
     def __init__(self):
         """Initialize database agent."""
         self.db = db_manager
+        
+        # Intent -> handler routing table
+        self._handlers: Dict[IntentName, Callable[[Dict[str, Any]], Mapping[str, Any]]] = {
+            "aggregate_query": self._handle_aggregate_query,
+            "filtered_query": self._handle_filtered_query,
+            "status_query": self._handle_status_query,
+            "group_by_query": self._handle_group_by_query,
+            "financial_query": self._handle_financial_query,
+            "maintenance_query": self._handle_maintenance_query,
+            "dashboard_query": self._handle_dashboard_query,
+            "insert": self._handle_insert,
+            "update": self._handle_update,
+            "delete": self._handle_delete,
+        }
     
-    def execute_query(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+    def invalidate_cache(self) -> None:
+        """Drop all cached query results.
+        
+        Writes through db_manager already make cached results unreachable by
+        bumping its write version; this only frees the memory early.
+        """
+        _result_cache.clear()
+        _query_cache.clear()
+    
+    def execute_query(self, intent_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Execute database query based on classified intent.
         
+        Successful results are cached by intent signature so repeated
+        queries skip SQLite entirely until the entry expires or the database
+        is written to. Cached results are returned as read-only views.
+        
         Args:
             intent_data: Intent classification from NLU agent
             
         Returns:
-            Dictionary with query results and metadata
+            Mapping with query results and metadata
         """
-        intent = intent_data.get("intent")
+        # Read the version before querying, so a write that commits while the
+        # query runs leaves this result under the old, unreachable key
+        cache_key = (
+            self.db.write_version,
+            make_cache_key({field: intent_data.get(field) for field in CACHE_KEY_FIELDS})
+        )
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Route to appropriate handler
-        if intent == "aggregate_query":
-            return self._handle_aggregate_query(intent_data)
-        elif intent == "filtered_query":
-            return self._handle_filtered_query(intent_data)
-        elif intent == "status_query":
-            return self._handle_status_query(intent_data)
-        elif intent == "group_by_query":
-            return self._handle_group_by_query(intent_data)
-        elif intent == "financial_query":
-            return self._handle_financial_query(intent_data)
-        elif intent == "maintenance_query":
-            return self._handle_maintenance_query(intent_data)
-        elif intent == "insert":
-            return self._handle_insert(intent_data)
-        elif intent == "update":
-            return self._handle_update(intent_data)
-        elif intent == "delete":
-            return self._handle_delete(intent_data)
-        else:
+        result = self._dispatch(intent_data)
+        if result.get("success") is not False:
+            result = _read_only(result)
+            _result_cache.set(cache_key, result)
+        return result
+    
+    def _dispatch(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Route the intent to the appropriate handler."""
+        handler = self._handlers.get(intent_data.get("intent"))
+        if handler is None:
             return {
                 "success": False,
                 "error": "Unknown intent",
                 "data": None
             }
+        return handler(intent_data)
+    
+    def _execute_cached(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        columnar: bool = False
+    ) -> Any:
+        """Execute a read query, reusing results for identical SQL and parameters.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            columnar: Return a columns/rows dict instead of a list of dicts
+        """
+        cache_key = (self.db.write_version, query, params, columnar)
+        results = _query_cache.get(cache_key)
+        if results is None:
+            if columnar:
+                results = self._fetch_columnar(query, params)
+            else:
+                results = self.db.execute_query(query, params)
+            _query_cache.set(cache_key, results)
+        return results
     
+    def _fetch_columnar(self, query: str, params: Optional[tuple] = None) -> Dict[str, Any]:
+        """Execute a read query and return ``{"columns": [...], "rows": [...]}``."""
+        columns, rows = self.db.execute_query_tuples(query, params)
+        return {"columns": columns, "rows": rows}
     
     def _handle_aggregate_query(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle aggregate queries like totals, counts, averages."""
@@ -74,7 +196,7 @@ class DatabaseAgent:
         )
         
         try:
-            results = self.db.execute_query(query, tuple(params) if params else None)
+            results = self._execute_cached(query, tuple(params) if params else None)
             value = results[0][agg_field] if results else 0
             
             return {
@@ -106,12 +228,12 @@ class DatabaseAgent:
         """
         
         try:
-            results = self.db.execute_query(query, tuple(params) if params else None)
+            results = self._fetch_columnar(query, tuple(params) if params else None)
             return {
                 "success": True,
                 "data": results,
                 "query_type": "filtered",
-                "row_count": len(results)
+                "row_count": len(results["rows"])
             }
         except Exception as e:
             return {"success": False, "error": str(e), "data": None}
@@ -131,12 +253,12 @@ class DatabaseAgent:
         """
         
         try:
-            results = self.db.execute_query(query, (status,))
+            results = self._fetch_columnar(query, (status,))
             return {
                 "success": True,
                 "data": results,
                 "query_type": "status",
-                "row_count": len(results)
+                "row_count": len(results["rows"])
             }
         except Exception as e:
             return {"success": False, "error": str(e), "data": None}
@@ -144,41 +266,34 @@ class DatabaseAgent:
     
     def _handle_group_by_query(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle group by queries."""
-        from agents.query_utils import FIELD_MAPPING
+        from agents.query_utils import FIELD_MAPPING, GROUP_BY_QUERIES
         
         group_field = intent_data.get("group_by_field", "department")
         column = FIELD_MAPPING.get(group_field, "department")
-        
-        query = f"""
-            SELECT {column} as group_name, 
-                   COUNT(*) as count,
-                   SUM(current_value) as total_value
-            FROM equipment
-            GROUP BY {column}
-            ORDER BY count DESC
-        """
+        query = GROUP_BY_QUERIES[column]
         
         try:
-            results = self.db.execute_query(query)
+            results = self._execute_cached(query, columnar=True)
             return {
                 "success": True,
                 "data": results,
                 "query_type": "group_by",
                 "group_field": column,
-                "row_count": len(results)
+                "row_count": len(results["rows"])
             }
         except Exception as e:
             return {"success": False, "error": str(e), "data": None}
     
     def _handle_financial_query(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle financial queries like depreciation."""
-        query_text = intent_data.get("original_query", "").lower()
+        query_text = intent_data.get("original_query", "")
         
-        if "depreciation" in query_text:
-            # Calculate total depreciation
+        if _DEPRECIATION_RE.search(query_text):
+            # Read the trigger-maintained running total
             query = """
-                SELECT SUM(purchase_price - current_value) as total_depreciation
-                FROM equipment
+                SELECT total_depreciation
+                FROM equipment_summary
+                WHERE id = 1
             """
             try:
                 results = self.db.execute_query(query)
@@ -197,9 +312,9 @@ class DatabaseAgent:
     
     def _handle_maintenance_query(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle maintenance-related queries."""
-        query_text = intent_data.get("original_query", "").lower()
+        query_text = intent_data.get("original_query", "")
         
-        if "due" in query_text or "upcoming" in query_text:
+        if _MAINTENANCE_DUE_RE.search(query_text):
             # Equipment due for maintenance
             today = datetime.now().date()
             next_month = (datetime.now() + timedelta(days=30)).date()
@@ -214,12 +329,12 @@ class DatabaseAgent:
             """
             
             try:
-                results = self.db.execute_query(query, (today, next_month))
+                results = self._fetch_columnar(query, (today, next_month))
                 return {
                     "success": True,
                     "data": results,
                     "query_type": "maintenance",
-                    "row_count": len(results)
+                    "row_count": len(results["rows"])
                 }
             except Exception as e:
                 return {"success": False, "error": str(e), "data": None}
@@ -227,31 +342,44 @@ class DatabaseAgent:
             # General maintenance info
             return self._handle_filtered_query(intent_data)
     
-    def _handle_insert(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_dashboard_query(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle overview queries that feed several scorecards in one round-trip."""
+        from agents.query_utils import build_where_clause, DASHBOARD_SUMMARY_QUERY
+        
+        entities = intent_data.get("entities", {})
+        filter_criteria = intent_data.get("filter_criteria", {})
+        
+        where_clause, params = build_where_clause(entities, filter_criteria)
+        query = DASHBOARD_SUMMARY_QUERY.format(where_clause=where_clause)
+        
+        try:
+            results = self._execute_cached(query, tuple(params) if params else None)
+            row = results[0] if results else {}
+            return {
+                "success": True,
+                "data": {
+                    "count": row.get("count") or 0,
+                    "total": row.get("total") or 0,
+                    "total_depreciation": row.get("total_depreciation") or 0,
+                },
+                "query_type": "dashboard",
+                "row_count": 1
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": None}
+    
+    def _handle_insert(self, intent_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Handle equipment insertion."""
         # For now, return a message that this requires more info
-        return {
-            "success": False,
-            "error": "Insert operation requires more detailed information",
-            "data": None,
-            "message": "Please provide: equipment name, category, department, and purchase price"
-        }
+        return INSERT_REQUIRES_INFO
     
-    def _handle_update(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_update(self, intent_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Handle equipment updates."""
-        return {
-            "success": False,
-            "error": "Update operation not yet implemented",
-            "data": None
-        }
+        return UPDATE_NOT_IMPLEMENTED
     
-    def _handle_delete(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_delete(self, intent_data: Dict[str, Any]) -> Mapping[str, Any]:
         """Handle equipment deletion."""
-        return {
-            "success": False,
-            "error": "Delete operation requires confirmation",
-            "data": None
-        }
+        return DELETE_REQUIRES_CONFIRMATION
 
 
 # Global database agent instance
@@ -0,0 +1,113 @@
+"""
+Fast Intent Classifier
+
+Rule-based pre-pass that classifies common, unambiguous queries with
+precompiled regular expressions so they can skip the LLM round-trip.
+Anything the rules do not fully match falls through to the NLU agent.
+"""
+
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from agents.nlu_agent import (
+    CANONICAL_QUERIES,
+    IntentClassification,
+    QueryIntent,
+    normalize_query,
+)
+
+
+# Confidence assigned to rule-based matches
+FAST_MATCH_CONFIDENCE = 0.95
+
+_PREFIX = r"(?:(?:show|list|display|get)(?: me)?(?: all| the)?\s+)?"
+_NOUN = r"(?:equipment|items|assets|inventory)"
+
+_STATUS_VALUES = {
+    "active": "Active",
+    "in maintenance": "In Maintenance",
+    "out of service": "Out of Service",
+    "retired": "Retired",
+    "on loan": "On Loan",
+}
+
+_STATUS_PATTERN = (
+    rf"{_PREFIX}(?:{_NOUN}\s+(?:that (?:is|are)\s+)?)?"
+    r"(?P<status>active|in maintenance|out of service|retired|on loan)"
+    rf"(?:\s+{_NOUN})?"
+)
+_GROUP_BY_PATTERN = (
+    rf"{_PREFIX}(?:{_NOUN}|count|breakdown|items)\s+(?:count\s+)?by\s+"
+    r"(?P<field>department|category|status|location|condition)"
+)
+_TOTAL_VALUE_PATTERN = (
+    r"(?:what(?:'s| is) (?:our |the )?)?total (?:equipment |inventory )?value"
+)
+_DEPRECIATION_PATTERN = (
+    r"(?:what(?:'s| is) (?:our |the )?)?(?:total )?depreciation"
+    r"(?: this (?:month|quarter|year))?"
+)
+_MAINTENANCE_DUE_PATTERN = (
+    rf"{_PREFIX}(?:{_NOUN}\s+)?(?:due for maintenance|upcoming maintenance)"
+    r"(?: this (?:week|month))?"
+)
+_SUMMARY_PATTERN = (
+    rf"{_PREFIX}(?:{_NOUN}\s+)?(?:summary|overview)"
+)
+
+# Rule name -> (pattern, classification fields builder), tried in this order
+_RULES: Dict[str, Tuple[str, Callable[[re.Match], Dict[str, Any]]]] = {
+    "status_rule": (_STATUS_PATTERN, lambda m: {
+        "intent": QueryIntent.STATUS_QUERY,
+        "entities": {"status": _STATUS_VALUES[m.group("status")]},
+    }),
+    "group_by_rule": (_GROUP_BY_PATTERN, lambda m: {
+        "intent": QueryIntent.GROUP_BY_QUERY,
+        "group_by_field": m.group("field"),
+    }),
+    "total_value_rule": (_TOTAL_VALUE_PATTERN, lambda m: {
+        "intent": QueryIntent.AGGREGATE_QUERY,
+        "aggregation_type": "sum",
+    }),
+    "depreciation_rule": (_DEPRECIATION_PATTERN, lambda m: {"intent": QueryIntent.FINANCIAL_QUERY}),
+    "maintenance_due_rule": (_MAINTENANCE_DUE_PATTERN, lambda m: {"intent": QueryIntent.MAINTENANCE_QUERY}),
+    "summary_rule": (_SUMMARY_PATTERN, lambda m: {"intent": QueryIntent.DASHBOARD_QUERY}),
+}
+
+# All rules as one alternation so a query is matched in a single pass; the
+# outer named group closes last, so lastgroup names the rule that matched
+_RULES_RE = re.compile("|".join(
+    f"(?P<{name}>{pattern})" for name, (pattern, _) in _RULES.items()
+))
+
+
+def try_fast_classify(user_query: str) -> Optional[IntentClassification]:
+    """Classify a query without the LLM when it matches a known pattern.
+
+    Args:
+        user_query: User's natural language query
+
+    Returns:
+        IntentClassification for recognized queries, otherwise None
+    """
+    key = normalize_query(user_query)
+
+    canonical = CANONICAL_QUERIES.get(key)
+    if canonical is not None:
+        return IntentClassification(
+            confidence=1.0,
+            explanation="Matched canonical query",
+            **canonical
+        )
+
+    text = key.rstrip("?.! ")
+    match = _RULES_RE.fullmatch(text)
+    if match is None:
+        return None
+
+    _, build = _RULES[match.lastgroup]
+    return IntentClassification(
+        confidence=FAST_MATCH_CONFIDENCE,
+        explanation="Matched fast classification rule",
+        **build(match)
+    )
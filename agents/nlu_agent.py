@@ -9,11 +9,8 @@ import os
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from pydantic import BaseModel, Field
-from langchain_openai import ChatOpenAI
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from database.cache import TTLCache
 
 
 class QueryIntent(str, Enum):
@@ -27,24 +24,42 @@ class QueryIntent(str, Enum):
     UPDATE = "update"                    # Modify existing equipment
     DELETE = "delete"                    # Remove equipment
     MAINTENANCE_QUERY = "maintenance_query"  # Maintenance-related queries
+    DASHBOARD_QUERY = "dashboard_query"  # Overview of count, value, depreciation
     UNKNOWN = "unknown"                  # Cannot determine intent
 
 
-class IntentClassification(BaseModel):
-    """Structured output for intent classification."""
-    intent: QueryIntent = Field(description="The classified intent of the user query")
-    confidence: float = Field(description="Confidence score between 0 and 1", ge=0, le=1)
-    
-    # Extracted entities as optional string fields
+class ExtractedEntities(BaseModel):
+    """Entities extracted from the user query."""
     department: Optional[str] = Field(default=None, description="Department name if mentioned")
     category: Optional[str] = Field(default=None, description="Equipment category if mentioned")
     status: Optional[str] = Field(default=None, description="Equipment status if mentioned")
     condition: Optional[str] = Field(default=None, description="Equipment condition if mentioned")
     equipment_name: Optional[str] = Field(default=None, description="Specific equipment name or type")
-    
-    # Filter criteria
+
+
+class FilterCriteria(BaseModel):
+    """Numeric filter criteria extracted from the user query."""
     price_min: Optional[float] = Field(default=None, description="Minimum price filter")
     price_max: Optional[float] = Field(default=None, description="Maximum price filter")
+
+
+class IntentClassification(BaseModel):
+    """Structured output for intent classification.
+    
+    Entities and filter criteria are nested so that dumping them yields the
+    dict shapes the database agent consumes directly.
+    """
+    intent: QueryIntent = Field(description="The classified intent of the user query")
+    confidence: float = Field(description="Confidence score between 0 and 1", ge=0, le=1)
+    
+    entities: ExtractedEntities = Field(
+        default_factory=ExtractedEntities,
+        description="Entities mentioned in the query"
+    )
+    filter_criteria: FilterCriteria = Field(
+        default_factory=FilterCriteria,
+        description="Price range filters mentioned in the query"
+    )
     
     # Aggregation and grouping
     aggregation_type: Optional[str] = Field(
@@ -59,28 +74,125 @@ class IntentClassification(BaseModel):
     explanation: str = Field(description="Brief explanation of the classification")
 
 
+# Canonical phrasings answered without calling the LLM.
+# Keys are normalized (stripped, lower-cased) user queries.
+CANONICAL_QUERIES: Dict[str, Dict[str, Any]] = {
+    "total equipment value": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "sum"},
+    "what's our total equipment value?": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "sum"},
+    "what is our total equipment value?": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "sum"},
+    "total value": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "sum"},
+    "equipment count": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "count"},
+    "count equipment": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "count"},
+    "how many equipment items do we have?": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "count"},
+    "average price": {"intent": QueryIntent.AGGREGATE_QUERY, "aggregation_type": "avg"},
+    "show all equipment": {"intent": QueryIntent.FILTERED_QUERY},
+    "show equipment": {"intent": QueryIntent.FILTERED_QUERY},
+    "show me equipment out of service": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "Out of Service"}},
+    "show equipment out of service": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "Out of Service"}},
+    "equipment out of service": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "Out of Service"}},
+    "out of service equipment": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "Out of Service"}},
+    "active equipment": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "Active"}},
+    "retired equipment": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "Retired"}},
+    "equipment in maintenance": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "In Maintenance"}},
+    "equipment on loan": {"intent": QueryIntent.STATUS_QUERY, "entities": {"status": "On Loan"}},
+    "equipment by department": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "department"},
+    "show equipment by department": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "department"},
+    "count by department": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "department"},
+    "equipment by category": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "category"},
+    "count by category": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "category"},
+    "equipment by status": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "status"},
+    "equipment by location": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "location"},
+    "equipment by condition": {"intent": QueryIntent.GROUP_BY_QUERY, "group_by_field": "condition"},
+    "what's our total depreciation?": {"intent": QueryIntent.FINANCIAL_QUERY},
+    "total depreciation": {"intent": QueryIntent.FINANCIAL_QUERY},
+    "depreciation": {"intent": QueryIntent.FINANCIAL_QUERY},
+    "equipment due for maintenance": {"intent": QueryIntent.MAINTENANCE_QUERY},
+    "equipment due for maintenance this month": {"intent": QueryIntent.MAINTENANCE_QUERY},
+    "upcoming maintenance": {"intent": QueryIntent.MAINTENANCE_QUERY},
+    "inventory summary": {"intent": QueryIntent.DASHBOARD_QUERY},
+    "equipment overview": {"intent": QueryIntent.DASHBOARD_QUERY},
+}
+
+
+def normalize_query(user_query: str) -> str:
+    """Normalize a user query for cache and canonical-phrase lookups."""
+    return " ".join(user_query.lower().split())
+
+
 class NLUAgent:
     """Natural Language Understanding Agent using OpenAI."""
     
     def __init__(self):
-        """Initialize NLU agent with OpenAI model."""
-        self.model = ChatOpenAI(
-            model=os.getenv("AGENT_MODEL", "gpt-4o-mini"),
-            temperature=float(os.getenv("AGENT_TEMPERATURE", "0.1"))
-        )
+        """Initialize NLU agent.
+        
+        The OpenAI model is created on first use, so queries answered by the
+        fast classifier or cache never pay the LangChain import cost.
+        """
+        self._structured_llm = None
         
-        # Create structured output model
-        self.structured_llm = self.model.with_structured_output(IntentClassification)
+        # Memoized classifications keyed by normalized query
+        self._cache = TTLCache(maxsize=1024, ttl=600)
+    
+    @property
+    def structured_llm(self):
+        """OpenAI model wrapped for structured IntentClassification output."""
+        if self._structured_llm is None:
+            from dotenv import load_dotenv
+            from langchain_openai import ChatOpenAI
+            
+            # Load environment variables
+            load_dotenv()
+            
+            model = ChatOpenAI(
+                model=os.getenv("AGENT_MODEL", "gpt-4o-mini"),
+                temperature=float(os.getenv("AGENT_TEMPERATURE", "0.1"))
+            )
+            
+            # Create structured output model
+            self._structured_llm = model.with_structured_output(IntentClassification)
+        return self._structured_llm
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized intent classifications."""
+        self._cache.clear()
     
-    def classify_intent(self, user_query: str) -> IntentClassification:
+    def classify_intent(
+        self,
+        user_query: str,
+        skip_fast_path: bool = False
+    ) -> IntentClassification:
         """Classify user intent and extract entities.
         
+        Common phrasings are answered by the rule-based fast classifier, and
+        repeated queries are served from an in-memory cache, so only new
+        queries reach the LLM.
+        
         Args:
             user_query: User's natural language query
+            skip_fast_path: Skip the fast classifier because the caller
+                already tried it and it did not match
             
         Returns:
             IntentClassification with intent, entities, and metadata
         """
+        if not skip_fast_path:
+            from agents.fast_classifier import try_fast_classify
+            
+            fast_result = try_fast_classify(user_query)
+            if fast_result is not None:
+                return fast_result
+        
+        key = normalize_query(user_query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._classify_with_llm(user_query)
+        self._cache.set(key, result)
+        return result
+    
+    def _classify_with_llm(self, user_query: str) -> IntentClassification:
+        """Classify user intent by calling the LLM."""
         system_prompt = """You are an expert at understanding equipment inventory queries.
 
 Analyze the user's query and classify their intent. Extract relevant entities and filter criteria.
@@ -92,6 +204,7 @@ Available intents:
 - group_by_query: User wants data grouped (e.g., "equipment by department", "count by category")
 - financial_query: User asks about money/depreciation (e.g., "depreciation this quarter", "maintenance costs")
 - maintenance_query: User asks about maintenance (e.g., "equipment due for maintenance", "maintenance schedule")
+- dashboard_query: User wants an overview of key metrics (e.g., "inventory summary", "equipment overview")
 - insert: User wants to add new equipment (e.g., "add a new laptop", "register equipment")
 - update: User wants to modify equipment (e.g., "update status", "change location")
 - delete: User wants to remove equipment (e.g., "delete equipment", "remove item")
@@ -120,36 +233,45 @@ For group by queries, identify the grouping field."""
         result = self.structured_llm.invoke(messages)
         return result
     
-    def process_query(self, user_query: str) -> Dict[str, Any]:
+    def process_query(
+        self,
+        user_query: str,
+        skip_fast_path: bool = False
+    ) -> Dict[str, Any]:
         """Process user query and return structured command.
         
         Args:
             user_query: User's natural language query
+            skip_fast_path: Skip the fast classifier (see classify_intent)
             
         Returns:
             Dictionary with intent, entities, and database command info
         """
-        classification = self.classify_intent(user_query)
-        
-        # Build entities dict from optional fields
-        entities = {}
-        if classification.department:
-            entities["department"] = classification.department
-        if classification.category:
-            entities["category"] = classification.category
-        if classification.status:
-            entities["status"] = classification.status
-        if classification.condition:
-            entities["condition"] = classification.condition
-        if classification.equipment_name:
-            entities["equipment_name"] = classification.equipment_name
+        classification = self.classify_intent(user_query, skip_fast_path)
+        return self.build_intent_data(classification, user_query)
+    
+    def build_intent_data(
+        self,
+        classification: IntentClassification,
+        user_query: str
+    ) -> Dict[str, Any]:
+        """Convert a classification into the intent dict used by other agents.
         
-        # Build filter criteria
-        filter_criteria = {}
-        if classification.price_min is not None:
-            filter_criteria["price_min"] = classification.price_min
-        if classification.price_max is not None:
-            filter_criteria["price_max"] = classification.price_max
+        Args:
+            classification: Classified intent and extracted entities
+            user_query: User's natural language query
+            
+        Returns:
+            Dictionary with intent, entities, and database command info
+        """
+        # Empty strings from the LLM are dropped along with None, so they never
+        # become "column = ''" filters; a zero price bound is still kept
+        entities = {
+            name: value
+            for name, value in classification.entities.model_dump().items()
+            if value
+        }
+        filter_criteria = classification.filter_criteria.model_dump(exclude_none=True)
         
         return {
             "intent": classification.intent.value,
@@ -5,43 +5,80 @@ Coordinates the multi-agent workflow using LangGraph.
 Routes user queries through NLU → Database → Response Generator.
 """
 
-from typing import TypedDict, List, Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Optional
 
-from langgraph.graph import StateGraph, END
-
-from agents.nlu_agent import nlu_agent
+from agents.fast_classifier import try_fast_classify
+from agents.nlu_agent import IntentClassification, nlu_agent
 from agents.database_agent import database_agent
 from agents.response_generator import response_generator
 from core.specs import WidgetSpec
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+
+# Worker threads used to run blocking agent calls from async callers
+EXECUTOR_MAX_WORKERS = 4
 
-class AgentState(TypedDict):
+
+@dataclass(slots=True)
+class AgentState:
     """State passed between agents in the workflow."""
-    user_input: str
-    intent_data: Dict[str, Any]
-    db_results: Dict[str, Any]
-    response: Dict[str, Any]
-    widgets: List[WidgetSpec]
-    message: str
-    error: str | None
+    user_input: str = ""
+    fast_path_missed: bool = False
+    intent_data: Dict[str, Any] = field(default_factory=dict)
+    db_results: Dict[str, Any] = field(default_factory=dict)
+    response: Dict[str, Any] = field(default_factory=dict)
+    widgets: List[WidgetSpec] = field(default_factory=list)
+    message: str = ""
+    error: Optional[str] = None
+
+
+def _state_fields(state: AgentState) -> Dict[str, Any]:
+    """Shallow-copy the state's fields into a dict (for LangGraph)."""
+    return {f.name: getattr(state, f.name) for f in fields(state)}
 
 
 class Orchestrator:
-    """Orchestrates the multi-agent workflow using LangGraph."""
+    """Orchestrates the multi-agent workflow.
     
-    def __init__(self):
-        """Initialize orchestrator with LangGraph workflow."""
-        self.workflow = self._build_workflow()
+    The pipeline is strictly linear (NLU → Database → Response), so by default
+    the nodes are called inline. The LangGraph workflow remains available via
+    ``use_graph=True`` for when branching or retries are needed.
+    """
     
-    def _build_workflow(self) -> StateGraph:
+    def __init__(self, use_graph: bool = False):
+        """Initialize orchestrator.
+        
+        Args:
+            use_graph: Run queries through the compiled LangGraph workflow
+                instead of calling the nodes inline
+        """
+        self.use_graph = use_graph
+        self.workflow = self._build_workflow() if use_graph else None
+        self._executor = ThreadPoolExecutor(
+            max_workers=EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="orchestrator"
+        )
+    
+    def close(self) -> None:
+        """Shut down the worker threads used by process_query_async."""
+        self._executor.shutdown(wait=True)
+    
+    def _build_workflow(self) -> "StateGraph":
         """Build the LangGraph workflow."""
+        from langgraph.graph import StateGraph, END
+        
         # Define the workflow graph
         workflow = StateGraph(AgentState)
         
         # Add nodes for each agent
-        workflow.add_node("nlu", self._nlu_node)
-        workflow.add_node("database", self._database_node)
-        workflow.add_node("response", self._response_node)
+        workflow.add_node("nlu", self._as_graph_node(self._nlu_node))
+        workflow.add_node("database", self._as_graph_node(self._database_node))
+        workflow.add_node("response", self._as_graph_node(self._response_node))
         
         # Define the flow
         workflow.set_entry_point("nlu")
@@ -52,55 +89,90 @@ class Orchestrator:
         # Compile the workflow
         return workflow.compile()
     
+    @staticmethod
+    def _as_graph_node(
+        node: Callable[[AgentState], AgentState]
+    ) -> Callable[[AgentState], Dict[str, Any]]:
+        """Adapt a node to LangGraph, which expects a dict of state updates."""
+        def graph_node(state: AgentState) -> Dict[str, Any]:
+            return _state_fields(node(state))
+        return graph_node
+    
     def _nlu_node(self, state: AgentState) -> AgentState:
         """NLU agent node - classify intent and extract entities."""
-        user_input = state["user_input"]
+        user_input = state.user_input
         
         try:
-            intent_data = nlu_agent.process_query(user_input)
-            state["intent_data"] = intent_data
-            state["error"] = None
+            intent_data = nlu_agent.process_query(
+                user_input, skip_fast_path=state.fast_path_missed
+            )
+            state.intent_data = intent_data
+            state.error = None
         except Exception as e:
-            state["error"] = f"NLU Error: {str(e)}"
-            state["intent_data"] = {}
+            state.error = f"NLU Error: {str(e)}"
+            state.intent_data = {}
         
         return state
     
     def _database_node(self, state: AgentState) -> AgentState:
         """Database agent node - execute queries."""
-        if state.get("error"):
+        if state.error:
             return state
         
-        intent_data = state["intent_data"]
+        intent_data = state.intent_data
         
         try:
             db_results = database_agent.execute_query(intent_data)
-            state["db_results"] = db_results
+            state.db_results = db_results
+        except Exception as e:
+            state.error = f"Database Error: {str(e)}"
+            state.db_results = {"success": False, "error": str(e)}
+        
+        return state
+    
+    async def _database_node_async(self, state: AgentState) -> AgentState:
+        """Database agent node for async callers.
+        
+        Runs the blocking SQLite work in the orchestrator's thread pool so the
+        event loop stays responsive. aiosqlite is deliberately not used: it
+        adds a thread hop per statement and is much slower for sequential
+        queries than one executor call per node.
+        """
+        if state.error:
+            return state
+        
+        loop = asyncio.get_running_loop()
+        
+        try:
+            db_results = await loop.run_in_executor(
+                self._executor, database_agent.execute_query, state.intent_data
+            )
+            state.db_results = db_results
         except Exception as e:
-            state["error"] = f"Database Error: {str(e)}"
-            state["db_results"] = {"success": False, "error": str(e)}
+            state.error = f"Database Error: {str(e)}"
+            state.db_results = {"success": False, "error": str(e)}
         
         return state
     
     def _response_node(self, state: AgentState) -> AgentState:
         """Response generator node - create widgets and messages."""
-        if state.get("error"):
-            state["widgets"] = []
-            state["message"] = f"❌ {state['error']}"
+        if state.error:
+            state.widgets = []
+            state.message = f"❌ {state.error}"
             return state
         
-        intent_data = state["intent_data"]
-        db_results = state["db_results"]
+        intent_data = state.intent_data
+        db_results = state.db_results
         
         try:
             response = response_generator.generate_response(intent_data, db_results)
-            state["response"] = response
-            state["widgets"] = response.get("widgets", [])
-            state["message"] = response.get("message", "✓ Query completed")
+            state.response = response
+            state.widgets = response.get("widgets", [])
+            state.message = response.get("message", "✓ Query completed")
         except Exception as e:
-            state["error"] = f"Response Error: {str(e)}"
-            state["widgets"] = []
-            state["message"] = f"❌ {state['error']}"
+            state.error = f"Response Error: {str(e)}"
+            state.widgets = []
+            state.message = f"❌ {state.error}"
         
         return state
     
@@ -113,25 +185,76 @@ class Orchestrator:
         Returns:
             Dictionary with widgets and response message
         """
-        # Initialize state
-        initial_state = {
-            "user_input": user_input,
-            "intent_data": {},
-            "db_results": {},
-            "response": {},
-            "widgets": [],
-            "message": "",
-            "error": None
-        }
+        classification = try_fast_classify(user_input)
+        if classification is not None:
+            return self._process_fast_path(user_input, classification)
+        
+        state = self._initial_state(user_input)
+        state.fast_path_missed = True
         
         # Execute workflow
-        final_state = self.workflow.invoke(initial_state)
+        if self.workflow is not None:
+            final_state = AgentState(**self.workflow.invoke(_state_fields(state)))
+        else:
+            final_state = self._response_node(self._database_node(self._nlu_node(state)))
+        
+        return self._build_result(final_state)
+    
+    async def process_query_async(self, user_input: str) -> Dict[str, Any]:
+        """Process user query without blocking the calling event loop.
+        
+        The NLU and database steps run in the orchestrator's thread pool;
+        response generation is pure Python and runs inline.
+        
+        Args:
+            user_input: User's natural language query
+            
+        Returns:
+            Dictionary with widgets and response message
+        """
+        state = self._initial_state(user_input)
+        
+        classification = try_fast_classify(user_input)
+        if classification is not None:
+            state.intent_data = nlu_agent.build_intent_data(classification, user_input)
+        else:
+            state.fast_path_missed = True
+            loop = asyncio.get_running_loop()
+            state = await loop.run_in_executor(self._executor, self._nlu_node, state)
         
+        state = await self._database_node_async(state)
+        return self._build_result(self._response_node(state))
+    
+    def _process_fast_path(
+        self,
+        user_input: str,
+        classification: IntentClassification
+    ) -> Dict[str, Any]:
+        """Run a rule-classified query directly, skipping the LLM and graph.
+        
+        Args:
+            user_input: User's natural language query
+            classification: Result of the fast classifier
+            
+        Returns:
+            Dictionary with widgets and response message
+        """
+        state = self._initial_state(user_input)
+        state.intent_data = nlu_agent.build_intent_data(classification, user_input)
+        
+        return self._build_result(self._response_node(self._database_node(state)))
+    
+    def _initial_state(self, user_input: str) -> AgentState:
+        """Create an empty workflow state for a query."""
+        return AgentState(user_input=user_input)
+    
+    def _build_result(self, final_state: AgentState) -> Dict[str, Any]:
+        """Build the public result dictionary from the final workflow state."""
         return {
-            "widgets": final_state.get("widgets", []),
-            "message": final_state.get("message", ""),
-            "intent": final_state.get("intent_data", {}).get("intent", "unknown"),
-            "success": final_state.get("error") is None
+            "widgets": final_state.widgets,
+            "message": final_state.message,
+            "intent": final_state.intent_data.get("intent", "unknown"),
+            "success": final_state.error is None
         }
 
 
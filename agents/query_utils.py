@@ -8,6 +8,36 @@ Separates query construction logic from business logic.
 from typing import Dict, Any, List, Tuple
 
 
+# Filterable fields in WHERE-clause order: (source, key, condition), where
+# source is "entities" or "filter_criteria"
+WHERE_FIELDS = (
+    ("entities", "category", "category = ?"),
+    ("entities", "department", "department = ?"),
+    ("entities", "status", "status = ?"),
+    ("entities", "condition", "condition = ?"),
+    ("filter_criteria", "price_min", "current_value >= ?"),
+    ("filter_criteria", "price_max", "current_value <= ?"),
+)
+
+
+def _build_where_templates() -> Dict[int, Tuple[str, Tuple[Tuple[str, str], ...]]]:
+    """Precompute the WHERE clause and parameter sources for every field combination."""
+    templates = {}
+    for mask in range(1 << len(WHERE_FIELDS)):
+        selected = [
+            where_field for bit, where_field in enumerate(WHERE_FIELDS)
+            if mask & (1 << bit)
+        ]
+        conditions = [condition for _, _, condition in selected]
+        clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        templates[mask] = (clause, tuple((source, key) for source, key, _ in selected))
+    return templates
+
+
+# Bitmask of present fields -> (where_clause, parameter sources)
+_WHERE_TEMPLATES = _build_where_templates()
+
+
 def build_where_clause(
     entities: Dict[str, Any],
     filter_criteria: Dict[str, Any] = None
@@ -15,6 +45,9 @@ def build_where_clause(
     """
     Build WHERE clause from entities and filter criteria.
     
+    The clause text comes from a precomputed table indexed by which fields
+    are present, so each combination always yields the same SQL.
+    
     Args:
         entities: Dictionary of entity filters (category, department, status, etc.)
         filter_criteria: Dictionary of additional filters (price_min, price_max, etc.)
@@ -22,36 +55,34 @@ def build_where_clause(
     Returns:
         Tuple of (where_clause_string, parameters_list)
     """
-    where_conditions = []
-    params = []
-    
-    # Entity-based filters
-    entity_mappings = {
-        "category": "category",
-        "department": "department",
-        "status": "status",
-        "condition": "condition"
-    }
-    
-    for entity_key, column_name in entity_mappings.items():
-        if entity_key in entities:
-            where_conditions.append(f"{column_name} = ?")
-            params.append(entities[entity_key])
-    
-    # Price range filters
-    if filter_criteria:
-        if "price_min" in filter_criteria:
-            where_conditions.append("current_value >= ?")
-            params.append(filter_criteria["price_min"])
-        
-        if "price_max" in filter_criteria:
-            where_conditions.append("current_value <= ?")
-            params.append(filter_criteria["price_max"])
+    sources = {"entities": entities, "filter_criteria": filter_criteria or {}}
     
-    # Build WHERE clause
-    where_clause = f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
+    # Bits follow WHERE_FIELDS order, matching _build_where_templates
+    mask = 0
+    for bit, (source, key, _) in enumerate(WHERE_FIELDS):
+        if key in sources[source]:
+            mask |= 1 << bit
+    where_clause, param_sources = _WHERE_TEMPLATES[mask]
     
-    return where_clause, params
+    return where_clause, [sources[source][key] for source, key in param_sources]
+
+
+# Constant SQL templates so each aggregation/WHERE combination yields
+# identical SQL text and reuses SQLite's cached prepared statement
+AGGREGATION_QUERIES = {
+    "total": "SELECT SUM(current_value) as total FROM equipment {where_clause}",
+    "count": "SELECT COUNT(*) as count FROM equipment {where_clause}",
+    "avg_price": "SELECT AVG(purchase_price) as avg_price FROM equipment {where_clause}",
+}
+
+
+# Count, total value and depreciation computed in a single table scan
+DASHBOARD_SUMMARY_QUERY = """
+    SELECT COUNT(*) as count,
+           SUM(current_value) as total,
+           SUM(depreciation_amount) as total_depreciation
+    FROM equipment {where_clause}
+"""
 
 
 def get_aggregation_query(
@@ -73,18 +104,16 @@ def get_aggregation_query(
     query_lower = query_text.lower()
     
     if "value" in query_lower:
-        query = f"SELECT SUM(current_value) as total FROM equipment {where_clause}"
         field = "total"
     elif "count" in query_lower or agg_type == "count":
-        query = f"SELECT COUNT(*) as count FROM equipment {where_clause}"
         field = "count"
     elif "price" in query_lower:
-        query = f"SELECT AVG(purchase_price) as avg_price FROM equipment {where_clause}"
         field = "avg_price"
     else:
-        query = f"SELECT COUNT(*) as count FROM equipment {where_clause}"
         field = "count"
     
+    query = AGGREGATION_QUERIES[field].format(where_clause=where_clause)
+    
     return query, field
 
 
@@ -95,3 +124,18 @@ FIELD_MAPPING = {
     "location": "location",
     "condition": "condition"
 }
+
+
+# One constant group-by statement per whitelisted column, so column names are
+# never interpolated per request and each query keeps a stable SQL text
+GROUP_BY_QUERIES = {
+    column: f"""
+            SELECT {column} as group_name, 
+                   COUNT(*) as count,
+                   SUM(current_value) as total_value
+            FROM equipment
+            GROUP BY {column}
+            ORDER BY count DESC
+        """
+    for column in FIELD_MAPPING.values()
+}
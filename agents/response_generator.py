@@ -4,19 +4,65 @@ Response Generator Agent - Widget Creation
 Converts database results into dashboard widgets and natural language responses.
 """
 
-from typing import Dict, Any, List
-import pandas as pd
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Tuple
 from core.specs import WidgetSpec, WidgetType
 
 
+# Formats a non-null numeric value as currency, e.g. 1234.5 -> "$1,234.50"
+_format_currency = "${:,.2f}".format
+
+# Scorecard result field -> (title, value formatter)
+_SCORECARD_FORMATS: Dict[str, Tuple[str, Callable[[Any], str]]] = {
+    "total": ("Total Equipment Value", _format_currency),
+    "count": ("Equipment Count", lambda value: f"{int(value):,}"),
+    "avg_price": ("Average Price", _format_currency),
+    "total_depreciation": ("Total Depreciation", _format_currency),
+}
+
+# Fixed widget-less responses, shared read-only instead of rebuilt per call
+QUERY_EXECUTED = MappingProxyType({
+    "widgets": (),
+    "message": "✓ Query executed successfully",
+    "success": True
+})
+NO_EQUIPMENT_FOUND = MappingProxyType({
+    "widgets": (),
+    "message": "No equipment found matching your criteria",
+    "success": True
+})
+NO_DATA_FOUND = MappingProxyType({
+    "widgets": (),
+    "message": "No data found",
+    "success": True
+})
+
+
 class ResponseGenerator:
     """Agent responsible for generating dashboard widgets and responses."""
     
+    __slots__ = ()
+    
+    # Database column -> display label for table widgets
+    _COLUMN_MAPPING = {
+        "asset_tag": "Asset Tag",
+        "name": "Equipment Name",
+        "category": "Category",
+        "department": "Department",
+        "status": "Status",
+        "current_value": "Value",
+        "location": "Location",
+        "assigned_to": "Assigned To",
+        "condition": "Condition",
+        "next_maintenance_date": "Next Maintenance",
+        "last_maintenance_date": "Last Maintenance"
+    }
+    
     def generate_response(
         self,
         intent_data: Dict[str, Any],
         db_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Generate dashboard widgets and text response from database results.
         
         Args:
@@ -33,103 +79,97 @@ class ResponseGenerator:
                 "success": False
             }
         
-        query_type = db_results.get("query_type")
-        
-        if query_type == "aggregate":
-            return self._create_aggregate_response(intent_data, db_results)
-        elif query_type == "filtered" or query_type == "status" or query_type == "maintenance":
-            return self._create_table_response(intent_data, db_results)
-        elif query_type == "group_by":
-            return self._create_group_by_response(intent_data, db_results)
-        elif query_type == "financial":
-            return self._create_financial_response(intent_data, db_results)
-        else:
-            return {
-                "widgets": [],
-                "message": "✓ Query executed successfully",
-                "success": True
-            }
+        builder = self._QUERY_DISPATCH.get(db_results.get("query_type"))
+        
+        if builder is None:
+            return QUERY_EXECUTED
+        
+        return builder(intent_data, db_results)
     
-    def _create_aggregate_response(
-        self,
-        intent_data: Dict[str, Any],
-        db_results: Dict[str, Any]
+    @staticmethod
+    def _create_scorecard_response(
+        widget_id: str,
+        field: str,
+        value: Any,
+        default_format: Tuple[str, Callable[[Any], str]]
     ) -> Dict[str, Any]:
-        """Create scorecard widget for aggregate queries."""
-        data = db_results.get("data", {})
-        value = data.get("value", 0)
-        field = data.get("field", "count")
+        """Create a single scorecard titled and formatted by its result field.
         
-        # Determine title and format
-        if field == "total" or "value" in intent_data.get("original_query", "").lower():
-            title = "Total Equipment Value"
-            formatted_value = f"${value:,.2f}"
-        elif field == "count":
-            title = "Equipment Count"
-            formatted_value = f"{int(value):,}"
-        elif field == "avg_price":
-            title = "Average Price"
-            formatted_value = f"${value:,.2f}"
-        else:
-            title = "Result"
-            formatted_value = f"{value:,.2f}"
+        Args:
+            widget_id: Identifier for the scorecard widget
+            field: Result field used to look up the title and formatter
+            value: Scorecard value
+            default_format: (title, formatter) used for unknown fields
+            
+        Returns:
+            Dictionary with the scorecard widget and response message
+        """
+        title, formatter = _SCORECARD_FORMATS.get(field, default_format)
         
         widget = WidgetSpec(
-            widget_id=f"aggregate_{field}",
+            widget_id=widget_id,
             widget_type=WidgetType.SCORECARD,
             title=title,
             data={"value": value}
         )
         
-        message = f"✓ {title}: {formatted_value}"
-        
         return {
             "widgets": [widget],
-            "message": message,
+            "message": f"✓ {title}: {formatter(value)}",
             "success": True
         }
     
-    def _create_table_response(
-        self,
+    @staticmethod
+    def _create_aggregate_response(
         intent_data: Dict[str, Any],
         db_results: Dict[str, Any]
     ) -> Dict[str, Any]:
+        """Create scorecard widget for aggregate queries."""
+        data = db_results.get("data", {})
+        value = data.get("value", 0)
+        field = data.get("field", "count")
+        
+        # Questions about value always read as the total value
+        format_key = field
+        if "value" in intent_data.get("original_query", "").lower():
+            format_key = "total"
+        
+        return ResponseGenerator._create_scorecard_response(
+            f"aggregate_{field}", format_key, value, ("Result", "{:,.2f}".format)
+        )
+    
+    @staticmethod
+    def _create_table_response(
+        intent_data: Dict[str, Any],
+        db_results: Dict[str, Any]
+    ) -> Mapping[str, Any]:
         """Create table widget for filtered queries."""
-        data = db_results.get("data", [])
-        row_count = db_results.get("row_count", 0)
+        import pandas as pd
         
-        if not data:
-            return {
-                "widgets": [],
-                "message": "No equipment found matching your criteria",
-                "success": True
-            }
+        data = db_results.get("data") or {"columns": [], "rows": []}
         
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        rows = data["rows"]
+        if not rows:
+            return NO_EQUIPMENT_FOUND
         
-        # Format currency columns
-        if "current_value" in df.columns:
-            df["current_value"] = df["current_value"].apply(
-                lambda x: f"${x:,.2f}" if pd.notna(x) else "N/A"
-            )
-        
-        # Rename columns for display
-        column_mapping = {
-            "asset_tag": "Asset Tag",
-            "name": "Equipment Name",
-            "category": "Category",
-            "department": "Department",
-            "status": "Status",
-            "current_value": "Value",
-            "location": "Location",
-            "assigned_to": "Assigned To",
-            "condition": "Condition",
-            "next_maintenance_date": "Next Maintenance",
-            "last_maintenance_date": "Last Maintenance"
-        }
+        # Build the display frame once, already relabeled. The table is only
+        # rendered as text, so object dtype skips per-column type inference
+        # and the mixed-dtype upcast when the renderer reads df.values
+        df = pd.DataFrame(
+            rows,
+            columns=[ResponseGenerator._COLUMN_MAPPING.get(c, c) for c in data["columns"]],
+            dtype=object
+        )
+        row_count = len(rows)
         
-        df = df.rename(columns=column_mapping)
+        # Format currency columns
+        value_label = ResponseGenerator._COLUMN_MAPPING["current_value"]
+        if value_label in df.columns:
+            values = df[value_label]
+            mask = values.notna()
+            formatted = pd.Series("N/A", index=df.index, dtype=object)
+            formatted[mask] = values[mask].map(_format_currency)
+            df[value_label] = formatted
         
         widget = WidgetSpec(
             widget_id="equipment_table",
@@ -146,28 +186,36 @@ class ResponseGenerator:
             "success": True
         }
     
+    @staticmethod
     def _create_group_by_response(
-        self,
         intent_data: Dict[str, Any],
         db_results: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Create bar chart widget for group by queries."""
-        data = db_results.get("data", [])
+        import pandas as pd
+        
+        data = db_results.get("data") or {"columns": [], "rows": []}
         group_field = db_results.get("group_field", "department")
         
-        if not data:
-            return {
-                "widgets": [],
-                "message": "No data found",
-                "success": True
-            }
+        if not data["rows"]:
+            return NO_DATA_FOUND
         
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        # Project the two charted columns straight out of the rows
+        name_idx = data["columns"].index("group_name")
+        count_idx = data["columns"].index("count")
+        names = [row[name_idx] for row in data["rows"]]
+        counts = [row[count_idx] for row in data["rows"]]
+        total_count = sum(counts)
         
-        # Create bar chart for counts
-        chart_df = df[["group_name", "count"]].copy()
-        chart_df.columns = [group_field.title(), "Count"]
+        # Create bar chart for counts; labels are stored as categorical codes,
+        # with categories kept in query order so bars stay sorted by count
+        labels = pd.Categorical(
+            names, categories=[name for name in names if name is not None]
+        )
+        chart_df = pd.DataFrame({
+            group_field.title(): labels,
+            "Count": counts
+        })
         
         widget = WidgetSpec(
             widget_id="group_by_chart",
@@ -176,8 +224,7 @@ class ResponseGenerator:
             data=chart_df
         )
         
-        total_count = df["count"].sum()
-        message = f"✓ Showing {len(data)} {group_field}s with {int(total_count)} total items"
+        message = f"✓ Showing {len(names)} {group_field}s with {total_count} total items"
         
         return {
             "widgets": [widget],
@@ -185,37 +232,73 @@ class ResponseGenerator:
             "success": True
         }
     
+    @staticmethod
     def _create_financial_response(
-        self,
         intent_data: Dict[str, Any],
         db_results: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create scorecard for financial queries."""
         data = db_results.get("data", {})
-        value = data.get("value", 0)
+        value = abs(data.get("value", 0))
         field = data.get("field", "total_depreciation")
         
-        if field == "total_depreciation":
-            title = "Total Depreciation"
-            formatted_value = f"${abs(value):,.2f}"
-            message = f"✓ Total Depreciation: ${abs(value):,.2f}"
-        else:
-            title = "Financial Result"
-            formatted_value = f"${value:,.2f}"
-            message = f"✓ Result: ${value:,.2f}"
+        return ResponseGenerator._create_scorecard_response(
+            "financial_metric", field, value, ("Financial Result", _format_currency)
+        )
+    
+    @staticmethod
+    def _create_dashboard_response(
+        intent_data: Dict[str, Any],
+        db_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create count, value and depreciation scorecards for overview queries."""
+        data = db_results.get("data", {})
+        count = data.get("count", 0)
+        total = data.get("total", 0)
+        depreciation = abs(data.get("total_depreciation", 0))
         
-        widget = WidgetSpec(
-            widget_id="financial_metric",
-            widget_type=WidgetType.SCORECARD,
-            title=title,
-            data={"value": abs(value)}
+        widgets = [
+            WidgetSpec(
+                widget_id="summary_count",
+                widget_type=WidgetType.SCORECARD,
+                title="Equipment Count",
+                data={"value": count}
+            ),
+            WidgetSpec(
+                widget_id="summary_total_value",
+                widget_type=WidgetType.SCORECARD,
+                title="Total Equipment Value",
+                data={"value": total}
+            ),
+            WidgetSpec(
+                widget_id="summary_depreciation",
+                widget_type=WidgetType.SCORECARD,
+                title="Total Depreciation",
+                data={"value": depreciation}
+            ),
+        ]
+        
+        message = (
+            f"✓ {int(count):,} items worth ${total:,.2f} "
+            f"with ${depreciation:,.2f} total depreciation"
         )
         
         return {
-            "widgets": [widget],
+            "widgets": widgets,
             "message": message,
             "success": True
         }
+    
+    # Database query_type -> response builder
+    _QUERY_DISPATCH = {
+        "aggregate": _create_aggregate_response,
+        "filtered": _create_table_response,
+        "status": _create_table_response,
+        "maintenance": _create_table_response,
+        "group_by": _create_group_by_response,
+        "financial": _create_financial_response,
+        "dashboard": _create_dashboard_response,
+    }
 
 
 # Global response generator instance
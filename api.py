@@ -5,12 +5,60 @@ This module provides the main entry point for creating dashboards
 using the dynamic dashboard library.
 """
 
+from functools import lru_cache
 from typing import Optional, Union
 
 from core.specs import DashboardSpec, validate_dashboard_spec
 from core.transform import transform_dashboard_spec
+from bi_adapters.base import BaseAdapter
 from bi_adapters.streamlit_adapter import StreamlitAdapter
-from themes import Theme
+from themes import Theme, get_theme
+
+
+# Maximum number of (adapter, theme) combinations kept alive for reuse
+ADAPTER_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=ADAPTER_CACHE_SIZE)
+def _build_adapter(adapter: str, theme: Theme) -> BaseAdapter:
+    """
+    Build an adapter instance, reused across renders for equal themes.
+    
+    Themes are frozen dataclasses, so equal themes share one cache entry
+    however many Theme objects are passed in.
+    
+    Args:
+        adapter: Name of the BI adapter ("streamlit", etc.)
+        theme: Resolved theme configuration
+        
+    Returns:
+        Adapter instance configured with the theme
+    """
+    return StreamlitAdapter(theme=theme)
+
+
+def _get_adapter(adapter: str, theme: Optional[Union[str, Theme]]) -> BaseAdapter:
+    """
+    Return the cached adapter instance for an adapter name and theme.
+    
+    Args:
+        adapter: Name of the BI adapter ("streamlit", etc.)
+        theme: Theme name (str) or Theme object (default: "professional")
+        
+    Returns:
+        Adapter instance configured with the resolved theme
+        
+    Raises:
+        ValueError: If the adapter is not supported
+    """
+    if adapter != "streamlit":
+        raise ValueError(f"Unsupported adapter: {adapter}")
+    
+    # Resolve names first so re-registered themes get a fresh adapter
+    if theme is None or isinstance(theme, str):
+        theme = get_theme(theme or "professional")
+    
+    return _build_adapter(adapter, theme)
 
 
 def create_dashboard(
@@ -56,10 +104,7 @@ def create_dashboard(
     config = transform_dashboard_spec(spec)
     
     # Get the adapter with theme
-    if adapter == "streamlit":
-        adapter_instance = StreamlitAdapter(theme=theme)
-    else:
-        raise ValueError(f"Unsupported adapter: {adapter}")
+    adapter_instance = _get_adapter(adapter, theme)
     
     # Render the dashboard
     adapter_instance.render_dashboard(config)
@@ -5,6 +5,7 @@ This adapter implements the BaseAdapter interface for Streamlit,
 allowing dashboards to be rendered as Streamlit apps.
 """
 
+from bisect import bisect_right
 from typing import Any, Dict, List, Union, Optional
 import streamlit as st
 import pandas as pd
@@ -14,6 +15,46 @@ from core.specs import WidgetType
 from core.transform import DashboardConfig, WidgetConfig
 from themes import get_theme, Theme, CSSBuilder, HTMLCardBuilder, HTMLTableBuilder
 
+# Plotly is optional; charts fall back to native Streamlit charts without it
+try:
+    import plotly.express as _px
+    _HAS_PLOTLY = True
+except ImportError:
+    _px = None
+    _HAS_PLOTLY = False
+
+
+def _value_from_dict(data: Dict[str, Any]) -> Any:
+    """Return the 'value' entry of a dict, or its first value."""
+    if "value" in data:
+        return data["value"]
+    return next(iter(data.values())) if data else 0
+
+
+def _value_from_list(data: List[Any]) -> Any:
+    """Return the first element of a list."""
+    return data[0] if data else 0
+
+
+def _value_from_frame(data: pd.DataFrame) -> Any:
+    """Return the top-left cell of a DataFrame."""
+    return data.iloc[0, 0] if not data.empty else 0
+
+
+# Lower bounds of each abbreviated magnitude and their (divisor, suffix)
+_MAGNITUDE_THRESHOLDS = (1_000, 1_000_000, 1_000_000_000)
+_MAGNITUDE_SUFFIXES = ((1_000, "K"), (1_000_000, "M"), (1_000_000_000, "B"))
+
+# Scorecard data type -> single-value extractor, checked in this order
+_VALUE_EXTRACTORS = {
+    int: lambda data: data,
+    float: lambda data: data,
+    str: lambda data: data,
+    dict: _value_from_dict,
+    list: _value_from_list,
+    pd.DataFrame: _value_from_frame,
+}
+
 
 class StreamlitAdapter(BaseAdapter):
     """
@@ -40,6 +81,59 @@ class StreamlitAdapter(BaseAdapter):
         self.css_builder = CSSBuilder(self.theme)
         self.card_builder = HTMLCardBuilder(self.theme)
         self.table_builder = HTMLTableBuilder(self.theme)
+        self._global_css: Optional[str] = None
+        
+        # Plotly layout pieces depend only on the theme, so build them once
+        self._build_chart_layout()
+        
+        # Widget type -> render method, built once for O(1) dispatch
+        self._renderers = {
+            WidgetType.SCORECARD: self.render_scorecard,
+            WidgetType.TIME_SERIES: self.render_time_series,
+            WidgetType.BAR_CHART: self.render_bar_chart,
+            WidgetType.TABLE: self.render_table,
+        }
+    
+    def _build_chart_layout(self) -> None:
+        """Precompute the theme-derived Plotly layout shared by all charts."""
+        colors = self.theme.colors
+        self._title_style = {
+            'font': {'size': 16, 'color': colors.text_primary, 'family': self.theme.typography.font_family, 'weight': 600},
+            'x': 0,
+            'xanchor': 'left',
+            'y': 0.98,
+            'yanchor': 'top'
+        }
+        axis_style = dict(
+            title_font={'size': 11, 'color': colors.text_muted},
+            tickfont={'size': 10, 'color': colors.text_muted},
+            showline=True,
+            linecolor=colors.chart_axis
+        )
+        grid_axis = dict(axis_style, showgrid=True, gridcolor=colors.chart_grid)
+        base_layout = dict(
+            plot_bgcolor=colors.card_background,
+            paper_bgcolor=colors.card_background,
+            margin=dict(l=10, r=10, t=50, b=10),
+            hovermode='x unified',
+            yaxis=grid_axis
+        )
+        
+        # Complete per-chart layouts; renderers only add the title text
+        self._line_layout = dict(
+            base_layout,
+            xaxis=grid_axis,
+            showlegend=True,
+            legend=dict(
+                font={'size': 10, 'color': colors.text_muted},
+                orientation='h',
+                yanchor='bottom',
+                y=1.02,
+                xanchor='right',
+                x=1
+            )
+        )
+        self._bar_layout = dict(base_layout, xaxis=dict(axis_style, showgrid=False))
     
     def render_dashboard(self, config: DashboardConfig) -> None:
         """
@@ -81,8 +175,11 @@ class StreamlitAdapter(BaseAdapter):
     
     def _inject_custom_css(self) -> None:
         """Inject custom CSS for professional dashboard styling using theme."""
-        css = self.css_builder.build_global_css()
-        st.markdown(css, unsafe_allow_html=True)
+        # Streamlit rebuilds the page on every rerun, so the style block must be
+        # emitted each render; only the theme-derived string is built once
+        if self._global_css is None:
+            self._global_css = self.css_builder.build_global_css()
+        st.markdown(self._global_css, unsafe_allow_html=True)
     
     def _render_grid_layout(self, config: DashboardConfig) -> None:
         """
@@ -96,11 +193,12 @@ class StreamlitAdapter(BaseAdapter):
         
         # If no explicit positions, render in rows of N columns
         if not widget_positions:
-            widgets = config.widgets
-            for i in range(0, len(widgets), columns_count):
-                cols = st.columns(columns_count)
-                for j, widget_config in enumerate(widgets[i:i + columns_count]):
-                    with cols[j]:
+            # Every row gets the full column count so a partial last row keeps
+            # the grid's widths; zip stops once the widgets run out
+            widgets = iter(config.widgets)
+            for _ in range(0, len(config.widgets), columns_count):
+                for col, widget_config in zip(st.columns(columns_count), widgets):
+                    with col:
                         self.render_widget(widget_config)
         else:
             # TODO: Implement explicit positioning
@@ -115,18 +213,11 @@ class StreamlitAdapter(BaseAdapter):
         Args:
             config: Widget configuration
         """
-        widget_type = config.widget_type
-        
-        if widget_type == WidgetType.SCORECARD:
-            self.render_scorecard(config)
-        elif widget_type == WidgetType.TIME_SERIES:
-            self.render_time_series(config)
-        elif widget_type == WidgetType.BAR_CHART:
-            self.render_bar_chart(config)
-        elif widget_type == WidgetType.TABLE:
-            self.render_table(config)
-        else:
-            st.warning(f"Widget type {widget_type} not yet implemented")
+        self._renderers.get(config.widget_type, self._render_unsupported)(config)
+    
+    def _render_unsupported(self, config: WidgetConfig) -> None:
+        """Show a warning for widget types without a renderer."""
+        st.warning(f"Widget type {config.widget_type} not yet implemented")
     
     def render_scorecard(self, config: WidgetConfig) -> None:
         """
@@ -161,79 +252,10 @@ class StreamlitAdapter(BaseAdapter):
         df = self._to_dataframe(data)
         
         # Use Plotly for better-looking charts
-        try:
-            import plotly.express as px
-            
-            # Get column names - assume first column is x-axis, rest are y-axis
-            columns = df.columns.tolist()
-            x_col = columns[0] if len(columns) > 0 else None
-            y_cols = columns[1:] if len(columns) > 1 else columns
-            
-            # Create line chart with explicit x and y
-            fig = px.line(
-                df,
-                x=x_col,
-                y=y_cols,
-                title=config.title,
-                template="plotly_white",
-                height=380
-            )
-            
-            # Customize layout for professional appearance using theme
-            colors = self.theme.colors
-            fig.update_layout(
-                title={
-                    'text': config.title,
-                    'font': {'size': 16, 'color': colors.text_primary, 'family': self.theme.typography.font_family, 'weight': 600},
-                    'x': 0,
-                    'xanchor': 'left',
-                    'y': 0.98,
-                    'yanchor': 'top'
-                },
-                plot_bgcolor=colors.card_background,
-                paper_bgcolor=colors.card_background,
-                margin=dict(l=10, r=10, t=50, b=10),
-                hovermode='x unified',
-                xaxis=dict(
-                    showgrid=True,
-                    gridcolor=colors.chart_grid,
-                    title_font={'size': 11, 'color': colors.text_muted},
-                    tickfont={'size': 10, 'color': colors.text_muted},
-                    showline=True,
-                    linecolor=colors.chart_axis
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor=colors.chart_grid,
-                    title_font={'size': 11, 'color': colors.text_muted},
-                    tickfont={'size': 10, 'color': colors.text_muted},
-                    showline=True,
-                    linecolor=colors.chart_axis
-                ),
-                showlegend=True,
-                legend=dict(
-                    font={'size': 10, 'color': colors.text_muted},
-                    orientation='h',
-                    yanchor='bottom',
-                    y=1.02,
-                    xanchor='right',
-                    x=1
-                )
-            )
-            
-            # Update line styling
-            fig.update_traces(
-                line=dict(width=2.5, color=colors.chart_primary),
-                hovertemplate='<b>%{y:,.0f}</b><extra></extra>'
-            )
-            
-            # Add border styling via Plotly
-            fig.update_xaxes(mirror=True)
-            fig.update_yaxes(mirror=True)
-            
+        if _HAS_PLOTLY:
+            fig = _build_line_figure(df, config.title, self.theme, self)
             st.plotly_chart(fig, width='stretch', config={'displayModeBar': False})
-            
-        except ImportError:
+        else:
             # Fallback to basic line chart if Plotly not available
             st.subheader(config.title)
             st.line_chart(df, width='stretch')
@@ -251,69 +273,10 @@ class StreamlitAdapter(BaseAdapter):
         df = self._to_dataframe(data)
         
         # Use Plotly for better-looking charts
-        try:
-            import plotly.express as px
-            
-            # Get column names - assume first column is x-axis, second is y-axis
-            columns = df.columns.tolist()
-            x_col = columns[0] if len(columns) > 0 else None
-            y_col = columns[1] if len(columns) > 1 else columns[0]
-            
-            # Create bar chart with explicit x and y
-            fig = px.bar(
-                df,
-                x=x_col,
-                y=y_col,
-                title=config.title,
-                template="plotly_white",
-                height=380
-            )
-            
-            # Customize layout for professional appearance using theme
-            colors = self.theme.colors
-            fig.update_layout(
-                title={
-                    'text': config.title,
-                    'font': {'size': 16, 'color': colors.text_primary, 'family': self.theme.typography.font_family, 'weight': 600},
-                    'x': 0,
-                    'xanchor': 'left',
-                    'y': 0.98,
-                    'yanchor': 'top'
-                },
-                plot_bgcolor=colors.card_background,
-                paper_bgcolor=colors.card_background,
-                margin=dict(l=10, r=10, t=50, b=10),
-                hovermode='x unified',
-                xaxis=dict(
-                    showgrid=False,
-                    title_font={'size': 11, 'color': colors.text_muted},
-                    tickfont={'size': 10, 'color': colors.text_muted},
-                    showline=True,
-                    linecolor=colors.chart_axis
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor=colors.chart_grid,
-                    title_font={'size': 11, 'color': colors.text_muted},
-                    tickfont={'size': 10, 'color': colors.text_muted},
-                    showline=True,
-                    linecolor=colors.chart_axis
-                )
-            )
-            
-            # Update bar styling
-            fig.update_traces(
-                marker_color=colors.chart_primary,
-                hovertemplate='<b>%{y:,.0f}</b><extra></extra>'
-            )
-            
-            # Add border styling
-            fig.update_xaxes(mirror=True)
-            fig.update_yaxes(mirror=True)
-            
+        if _HAS_PLOTLY:
+            fig = _build_bar_figure(df, config.title, self.theme, self)
             st.plotly_chart(fig, width='stretch', config={'displayModeBar': False})
-            
-        except ImportError:
+        else:
             # Fallback to basic bar chart if Plotly not available
             st.subheader(config.title)
             st.bar_chart(df, width='stretch')
@@ -330,8 +293,8 @@ class StreamlitAdapter(BaseAdapter):
         # Convert to DataFrame if needed
         df = self._to_dataframe(data)
         
-        # Use HTML table builder to generate table
-        table_html = self.table_builder.build_table(df, config.title)
+        # Use HTML table builder to generate table (cached across reruns)
+        table_html = _build_table_html(df, config.title, self.theme, self)
         
         st.markdown(table_html, unsafe_allow_html=True)
     
@@ -347,24 +310,14 @@ class StreamlitAdapter(BaseAdapter):
         Returns:
             Extracted value
         """
-        # If it's already a scalar, return it
-        if isinstance(data, (int, float, str)):
-            return data
+        extractor = _VALUE_EXTRACTORS.get(type(data))
+        if extractor is not None:
+            return extractor(data)
         
-        # If it's a dict, try to get 'value' key or first value
-        if isinstance(data, dict):
-            if "value" in data:
-                return data["value"]
-            # Return first value
-            return next(iter(data.values())) if data else 0
-        
-        # If it's a list, return first element
-        if isinstance(data, list):
-            return data[0] if data else 0
-        
-        # If it's a DataFrame, get the first value
-        if isinstance(data, pd.DataFrame):
-            return data.iloc[0, 0] if not data.empty else 0
+        # Subclasses (bool, numpy floats, ...) fall back to the isinstance walk
+        for base, extractor in _VALUE_EXTRACTORS.items():
+            if isinstance(data, base):
+                return extractor(data)
         
         # Default
         return str(data)
@@ -407,14 +360,12 @@ class StreamlitAdapter(BaseAdapter):
         abs_value = abs(value)
         sign = "-" if value < 0 else ""
         
-        if abs_value >= 1_000_000_000:
-            return f"{sign}${abs_value / 1_000_000_000:.1f}B"
-        elif abs_value >= 1_000_000:
-            return f"{sign}${abs_value / 1_000_000:.1f}M"
-        elif abs_value >= 1_000:
-            return f"{sign}${abs_value / 1_000:.1f}K"
-        else:
+        # "not >=" also routes NaN to the plain format
+        if not abs_value >= 1_000:
             return f"{sign}${abs_value:,.0f}"
+        
+        divisor, suffix = _MAGNITUDE_SUFFIXES[bisect_right(_MAGNITUDE_THRESHOLDS, abs_value) - 1]
+        return f"{sign}${abs_value / divisor:.1f}{suffix}"
     
     def _render_sparkline_svg(self, data: List[float]) -> str:
         """
@@ -434,21 +385,16 @@ class StreamlitAdapter(BaseAdapter):
         max_val = max(data)
         range_val = max_val - min_val if max_val != min_val else 1
         
-        normalized = [(v - min_val) / range_val for v in data]
-        
         # SVG dimensions
         width = 120
         height = 30
         
-        # Calculate points for polyline
+        # Calculate polyline points in one pass (Y axis inverted)
         x_step = width / (len(data) - 1)
-        points = []
-        for i, val in enumerate(normalized):
-            x = i * x_step
-            y = height - (val * height)  # Invert Y axis
-            points.append(f"{x},{y}")
-        
-        points_str = " ".join(points)
+        points_str = " ".join(
+            f"{i * x_step},{height - ((v - min_val) / range_val) * height}"
+            for i, v in enumerate(data)
+        )
         
         # Create SVG
         svg = f"""
@@ -476,15 +422,146 @@ class StreamlitAdapter(BaseAdapter):
         Returns:
             DataFrame representation
         """
-        if isinstance(data, pd.DataFrame):
+        # Fast exact-type hit for frames built by the response generator
+        if type(data) is pd.DataFrame:
             return data
         
         if isinstance(data, dict):
-            return pd.DataFrame(data)
+            # Column -> values mapping, or a single record of scalars
+            if any(pd.api.types.is_list_like(v) for v in data.values()):
+                return pd.DataFrame(data)
+            return pd.DataFrame([data])
         
         if isinstance(data, list):
             return pd.DataFrame(data)
         
-        # Default: create a simple DataFrame
-        return pd.DataFrame([data])
+        # DataFrame subclasses fall back to the isinstance check
+        if isinstance(data, pd.DataFrame):
+            return data
+        
+        # Default: a single scalar becomes a one-cell "value" column
+        return pd.DataFrame({"value": [data]})
+
 
+# Figure and table builders are cached across Streamlit reruns on the data,
+# title and theme. The Theme itself is hashed by value, so a custom theme that
+# reuses a registered name gets its own entries; the underscore-prefixed
+# adapter argument is not hashed.
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_line_figure(df: pd.DataFrame, title: str, theme: Theme, _adapter: StreamlitAdapter):
+    """
+    Build the themed Plotly line chart for a time series widget.
+    
+    Args:
+        df: Chart data, first column on the x-axis
+        title: Chart title
+        theme: The adapter's theme (part of the cache key)
+        _adapter: Adapter providing the precomputed layout (not hashed)
+        
+    Returns:
+        Plotly figure
+    """
+    # Get column names - assume first column is x-axis, rest are y-axis
+    columns = df.columns
+    x_col = columns[0] if len(columns) > 0 else None
+    y_cols = list(columns[1:] if len(columns) > 1 else columns)
+    
+    # Create line chart with explicit x and y
+    fig = _px.line(
+        df,
+        x=x_col,
+        y=y_cols,
+        title=title,
+        template="plotly_white",
+        height=380
+    )
+    
+    # Customize layout for professional appearance using theme
+    colors = theme.colors
+    fig.update_layout(
+        title={'text': title, **_adapter._title_style},
+        **_adapter._line_layout
+    )
+    
+    # Update line styling
+    fig.update_traces(
+        line=dict(width=2.5, color=colors.chart_primary),
+        hovertemplate='<b>%{y:,.0f}</b><extra></extra>'
+    )
+    
+    # Add border styling via Plotly
+    fig.update_xaxes(mirror=True)
+    fig.update_yaxes(mirror=True)
+    
+    return fig
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_bar_figure(df: pd.DataFrame, title: str, theme: Theme, _adapter: StreamlitAdapter):
+    """
+    Build the themed Plotly bar chart for a bar chart widget.
+    
+    Args:
+        df: Chart data, first column on the x-axis
+        title: Chart title
+        theme: The adapter's theme (part of the cache key)
+        _adapter: Adapter providing the precomputed layout (not hashed)
+        
+    Returns:
+        Plotly figure
+    """
+    # Get column names - assume first column is x-axis, second is y-axis
+    columns = df.columns
+    x_col = columns[0] if len(columns) > 0 else None
+    y_col = columns[1] if len(columns) > 1 else columns[0]
+    
+    # Only the first two columns are plotted; hand Plotly just those
+    if len(columns) > 2:
+        df = df.iloc[:, :2]
+    
+    # Create bar chart with explicit x and y
+    fig = _px.bar(
+        df,
+        x=x_col,
+        y=y_col,
+        title=title,
+        template="plotly_white",
+        height=380
+    )
+    
+    # Customize layout for professional appearance using theme
+    colors = theme.colors
+    fig.update_layout(
+        title={'text': title, **_adapter._title_style},
+        **_adapter._bar_layout
+    )
+    
+    # Update bar styling
+    fig.update_traces(
+        marker_color=colors.chart_primary,
+        hovertemplate='<b>%{y:,.0f}</b><extra></extra>'
+    )
+    
+    # Add border styling
+    fig.update_xaxes(mirror=True)
+    fig.update_yaxes(mirror=True)
+    
+    return fig
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_table_html(df: pd.DataFrame, title: str, theme: Theme, _adapter: StreamlitAdapter) -> str:
+    """
+    Build the themed HTML markup for a table widget.
+    
+    Args:
+        df: Table data
+        title: Table title
+        theme: The adapter's theme (part of the cache key)
+        _adapter: Adapter providing the table builder (not hashed)
+        
+    Returns:
+        HTML string for the table
+    """
+    return _adapter.table_builder.build_table(df, title)
@@ -5,18 +5,71 @@ Integrates the LangGraph multi-agent system with the Streamlit chat interface.
 Handles message processing and dashboard state management.
 """
 
-from typing import List
+from collections import deque
+from typing import Any, Dict, List
 
 import streamlit as st
 
 from core.specs import DashboardSpec, WidgetSpec
+from agents.nlu_agent import normalize_query
 from agents.orchestrator import orchestrator
+from database.db_manager import db_manager
+
+
+# Oldest widgets drop off the dashboard beyond this many
+MAX_DASHBOARD_WIDGETS = 50
+
+# Seconds a cached orchestrator result is reused when nothing is written;
+# a committed write bumps db_manager.write_version and retires it sooner
+ORCHESTRATOR_CACHE_TTL = 60
+
+
+class _UncachedResult(Exception):
+    """Carries a failed orchestrator result out of the cached call uncached."""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("message"))
+        self.result = result
+
+
+@st.cache_data(ttl=ORCHESTRATOR_CACHE_TTL, max_entries=64, show_spinner=False)
+def _run_orchestrator(
+    cache_key: str,
+    write_version: int,
+    _query: str
+) -> Dict[str, Any]:
+    """
+    Run a user query through the orchestrator, caching successes.
+    
+    Only the normalized cache key and the database write version are
+    hashed; the query itself is passed through as typed so entity
+    extraction sees the original casing. Any committed write bumps the
+    write version, so answers cached before it are never served again.
+    Failed results are raised as _UncachedResult so Streamlit does not
+    store them and the next attempt runs the pipeline again.
+    
+    Args:
+        cache_key: Normalized user query (part of the cache key)
+        write_version: db_manager.write_version at call time (part of the
+            cache key)
+        _query: User query as typed (not hashed)
+        
+    Returns:
+        Orchestrator result dictionary
+    """
+    result = orchestrator.process_query(_query)
+    if not result.get("success", True):
+        raise _UncachedResult(result)
+    return result
 
 
 def initialize_session_state() -> None:
     """Initialize session state for widgets if not already present."""
     if "widgets" not in st.session_state:
-        st.session_state.widgets = []
+        st.session_state.widgets = deque(maxlen=MAX_DASHBOARD_WIDGETS)
+    
+    if "dashboard_version" not in st.session_state:
+        st.session_state.dashboard_version = 0
 
 
 def update_dashboard(widgets: List[WidgetSpec]) -> None:
@@ -30,11 +83,17 @@ def update_dashboard(widgets: List[WidgetSpec]) -> None:
         return
     
     st.session_state.widgets.extend(widgets)
-    st.session_state.current_dashboard = DashboardSpec(
-        dashboard_id="equipment_dashboard",
-        title="Equipment Inventory Dashboard",
-        widgets=st.session_state.widgets
-    )
+    
+    # Tells the renderer its cached dashboard config is stale
+    st.session_state.dashboard_version = st.session_state.get("dashboard_version", 0) + 1
+    
+    # The spec shares the session's widget deque, so build it only once
+    if st.session_state.get("current_dashboard") is None:
+        st.session_state.current_dashboard = DashboardSpec(
+            dashboard_id="equipment_dashboard",
+            title="Equipment Inventory Dashboard",
+            widgets=st.session_state.widgets
+        )
 
 
 def process_user_message(user_input: str) -> str:
@@ -54,8 +113,13 @@ def process_user_message(user_input: str) -> str:
     initialize_session_state()
     
     try:
-        # Process query through multi-agent workflow
-        result = orchestrator.process_query(user_input)
+        # Process query through multi-agent workflow (repeat questions are cached)
+        try:
+            result = _run_orchestrator(
+                normalize_query(user_input), db_manager.write_version, user_input
+            )
+        except _UncachedResult as failed:
+            result = failed.result
         
         # Extract results
         new_widgets = result.get("widgets", [])
@@ -19,6 +19,10 @@ class WidgetType(Enum):
     TABLE = "table"
     FILTER = "filter"
     TEXT = "text"
+    
+    # Members are singletons compared by identity, so hash by identity too;
+    # this keeps type-keyed dispatch tables on the C-level object hash
+    __hash__ = object.__hash__
 
 
 class AggregationType(Enum):
@@ -31,7 +35,7 @@ class AggregationType(Enum):
     DISTINCT_COUNT = "distinct_count"
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetSpec:
     """
     Specification for a single dashboard widget.
@@ -60,7 +64,7 @@ class WidgetSpec:
     config: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardSpec:
     """
     Specification for a complete dashboard.
@@ -146,8 +150,13 @@ def validate_dashboard_spec(spec: DashboardSpec) -> None:
     for widget in spec.widgets:
         validate_widget_spec(widget)
     
-    # Check for duplicate widget IDs
-    widget_ids = [w.widget_id for w in spec.widgets]
-    if len(widget_ids) != len(set(widget_ids)):
-        duplicates = [wid for wid in widget_ids if widget_ids.count(wid) > 1]
-        raise ValidationError(f"Duplicate widget IDs found: {set(duplicates)}")
+    # Check for duplicate widget IDs in a single pass
+    seen = set()
+    duplicates = set()
+    for widget in spec.widgets:
+        if widget.widget_id in seen:
+            duplicates.add(widget.widget_id)
+        else:
+            seen.add(widget.widget_id)
+    if duplicates:
+        raise ValidationError(f"Duplicate widget IDs found: {duplicates}")
@@ -11,7 +11,7 @@ from typing import Any, Dict, List
 from core.specs import DashboardSpec, WidgetSpec, WidgetType, AggregationType
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetConfig:
     """
     Normalized, BI-agnostic widget configuration.
@@ -34,7 +34,7 @@ class WidgetConfig:
     display_config: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardConfig:
     """
     Normalized, BI-agnostic dashboard configuration.
@@ -81,16 +81,15 @@ def transform_widget_spec(spec: WidgetSpec) -> WidgetConfig:
     }
     
     # Extract display configuration from widget config
-    # Separate display concerns from data concerns
+    # Separate display concerns from data concerns; widget config overrides
+    # the defaults and any other display-related keys pass through
     display_config = {
-        "show_legend": spec.config.get("show_legend", True),
-        "color_scheme": spec.config.get("color_scheme", "default"),
-        "number_format": spec.config.get("number_format", "auto"),
-        "date_format": spec.config.get("date_format", "auto"),
-        # Pass through any other display-related config
-        **{k: v for k, v in spec.config.items() 
-           if k not in ("show_legend", "color_scheme", "number_format", "date_format")}
+        "show_legend": True,
+        "color_scheme": "default",
+        "number_format": "auto",
+        "date_format": "auto",
     }
+    display_config.update(spec.config)
     
     return WidgetConfig(
         widget_id=spec.widget_id,
@@ -117,12 +116,11 @@ def transform_dashboard_spec(spec: DashboardSpec) -> DashboardConfig:
     
     # Normalize layout configuration
     layout_config = {
-        "type": spec.layout.get("type", "grid"),  # default to grid layout
-        "columns": spec.layout.get("columns", 12),  # 12-column grid by default
-        "widget_positions": spec.layout.get("widget_positions", {}),
-        **{k: v for k, v in spec.layout.items() 
-           if k not in ("type", "columns", "widget_positions")}
+        "type": "grid",  # default to grid layout
+        "columns": 12,  # 12-column grid by default
+        "widget_positions": {},
     }
+    layout_config.update(spec.layout)
     
     # Normalize global filter configuration
     global_filter_config = {
@@ -8,8 +8,68 @@ import streamlit as st
 from typing import List
 
 from bi_adapters.streamlit_adapter import StreamlitAdapter
-from core.specs import WidgetType
-from core.transform import transform_dashboard_spec, WidgetConfig
+from core.specs import DashboardSpec, WidgetType
+from core.transform import transform_dashboard_spec, DashboardConfig, WidgetConfig
+
+
+# Widget types laid out together in the charts section
+CHART_WIDGET_TYPES = frozenset({
+    WidgetType.TIME_SERIES,
+    WidgetType.BAR_CHART,
+    WidgetType.PIE_CHART,
+})
+
+# Vertical gap emitted between dashboard sections
+SECTION_SPACER_HTML = "<div style='margin-top: 20px;'></div>"
+
+# Widget type -> index of its section in (scorecards, charts, tables);
+# other types are not laid out by the auto-organizer
+_WIDGET_SECTIONS = {
+    WidgetType.SCORECARD: 0,
+    **dict.fromkeys(CHART_WIDGET_TYPES, 1),
+    WidgetType.TABLE: 2,
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_dashboard_adapter(theme_name: str) -> StreamlitAdapter:
+    """
+    Return the process-wide adapter for a theme.
+    
+    The adapter and its theme-derived layout, CSS and renderer table are
+    immutable once built, so one instance is shared across reruns and sessions.
+    
+    Args:
+        theme_name: Registered theme name
+        
+    Returns:
+        Streamlit adapter configured with the theme
+    """
+    return StreamlitAdapter(theme=theme_name)
+
+
+def get_dashboard_config(dashboard_spec: DashboardSpec) -> DashboardConfig:
+    """
+    Return the normalized config for a spec, reusing it across reruns.
+    
+    The config is kept in session state keyed by the spec's identity and the
+    session's dashboard_version, which the chat handler bumps whenever it adds
+    widgets, so unchanged dashboards skip transform_dashboard_spec.
+    
+    Args:
+        dashboard_spec: Dashboard specification
+        
+    Returns:
+        Normalized dashboard configuration
+    """
+    key = (id(dashboard_spec), st.session_state.get("dashboard_version", 0))
+    cached = st.session_state.get("dashboard_config_cache")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    config = transform_dashboard_spec(dashboard_spec)
+    st.session_state.dashboard_config_cache = (key, config)
+    return config
 
 
 def organize_widgets_by_type(widgets: List[WidgetConfig]) -> tuple:
@@ -22,23 +82,50 @@ def organize_widgets_by_type(widgets: List[WidgetConfig]) -> tuple:
     Returns:
         Tuple of (scorecards, charts, tables)
     """
-    scorecards = []
-    charts = []
-    tables = []
+    sections = ([], [], [])
     
     for widget_config in widgets:
-        if widget_config.widget_type == WidgetType.SCORECARD:
-            scorecards.append(widget_config)
-        elif widget_config.widget_type in [
-            WidgetType.TIME_SERIES, 
-            WidgetType.BAR_CHART, 
-            WidgetType.PIE_CHART
-        ]:
-            charts.append(widget_config)
-        elif widget_config.widget_type == WidgetType.TABLE:
-            tables.append(widget_config)
+        index = _WIDGET_SECTIONS.get(widget_config.widget_type)
+        if index is not None:
+            sections[index].append(widget_config)
     
-    return scorecards, charts, tables
+    return sections
+
+
+def render_in_rows(
+    adapter: StreamlitAdapter,
+    widgets: List[WidgetConfig],
+    per_row: int,
+    single_full_width: bool = False
+) -> None:
+    """
+    Render widgets left to right in rows of up to ``per_row`` columns.
+    
+    Walks one iterator over the widgets instead of slicing a list per row.
+    Each row gets one column per widget it holds, so a short final row is
+    split evenly across the widgets that remain.
+    
+    Args:
+        adapter: Streamlit adapter instance
+        widgets: Widget configurations in display order
+        per_row: Maximum widgets per row
+        single_full_width: Render a row holding a single widget at full width,
+            outside any columns container
+    """
+    widget_iter = iter(widgets)
+    remaining = len(widgets)
+    
+    while remaining > 0:
+        row_count = min(per_row, remaining)
+        remaining -= row_count
+        
+        if row_count == 1 and single_full_width:
+            adapter.render_widget(next(widget_iter))
+            continue
+        
+        for col, widget_config in zip(st.columns(row_count), widget_iter):
+            with col:
+                adapter.render_widget(widget_config)
 
 
 def render_scorecards(adapter: StreamlitAdapter, scorecards: List[WidgetConfig]) -> None:
@@ -49,15 +136,7 @@ def render_scorecards(adapter: StreamlitAdapter, scorecards: List[WidgetConfig])
         adapter: Streamlit adapter instance
         scorecards: List of scorecard widget configurations
     """
-    if not scorecards:
-        return
-    
-    for i in range(0, len(scorecards), 4):
-        row_scorecards = scorecards[i:i+4]
-        cols = st.columns(len(row_scorecards))
-        for j, widget_config in enumerate(row_scorecards):
-            with cols[j]:
-                adapter.render_widget(widget_config)
+    render_in_rows(adapter, scorecards, 4)
 
 
 def render_charts(adapter: StreamlitAdapter, charts: List[WidgetConfig]) -> None:
@@ -68,20 +147,8 @@ def render_charts(adapter: StreamlitAdapter, charts: List[WidgetConfig]) -> None
         adapter: Streamlit adapter instance
         charts: List of chart widget configurations
     """
-    if not charts:
-        return
-    
-    for i in range(0, len(charts), 2):
-        row_charts = charts[i:i+2]
-        if len(row_charts) == 1:
-            # Single chart - full width
-            adapter.render_widget(row_charts[0])
-        else:
-            # Two charts side by side
-            cols = st.columns(2)
-            for j, widget_config in enumerate(row_charts):
-                with cols[j]:
-                    adapter.render_widget(widget_config)
+    # Two charts side by side; a trailing single chart spans the full width
+    render_in_rows(adapter, charts, 2, single_full_width=True)
 
 
 def render_tables(adapter: StreamlitAdapter, tables: List[WidgetConfig]) -> None:
@@ -111,11 +178,11 @@ def render_dashboard_widgets(dashboard_spec) -> None:
     Args:
         dashboard_spec: Dashboard specification
     """
-    # Create adapter with dark theme
-    adapter = StreamlitAdapter(theme="dark")
+    # Reuse the cached dark-theme adapter
+    adapter = _get_dashboard_adapter("dark")
     
-    # Transform the dashboard spec to config
-    config = transform_dashboard_spec(dashboard_spec)
+    # Transform the dashboard spec to config (cached until widgets change)
+    config = get_dashboard_config(dashboard_spec)
     
     # Organize widgets by type
     scorecards, charts, tables = organize_widgets_by_type(config.widgets)
@@ -125,14 +192,14 @@ def render_dashboard_widgets(dashboard_spec) -> None:
     
     # Add spacing after scorecards
     if scorecards and (charts or tables):
-        st.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
+        st.markdown(SECTION_SPACER_HTML, unsafe_allow_html=True)
     
     # Render charts in the middle
     render_charts(adapter, charts)
     
     # Add spacing after charts
     if charts and tables:
-        st.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
+        st.markdown(SECTION_SPACER_HTML, unsafe_allow_html=True)
     
     # Render tables at the bottom
     render_tables(adapter, tables)
@@ -4,11 +4,63 @@ Database manager for equipment inventory system.
 Handles database connections, initialization, and common operations.
 """
 
+import queue
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import contextmanager
 
+from database.cache import TTLCache
+
+
+# Number of prepared statements SQLite keeps per connection, keyed by SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# Maximum number of pooled read-only connections
+READ_POOL_SIZE = 4
+
+# Seconds a whole-table aggregate (count, total value, ...) is reused before
+# being recomputed; writes through this manager drop it immediately
+AGGREGATE_CACHE_TTL = 60
+
+# Pragmas applied to every connection (journal_mode=WAL is persistent and
+# set once per database file)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+# Hot statements, kept as constants so every call reuses the same prepared
+# statement from the connection's statement cache
+_COUNT_SQL = "SELECT COUNT(*) as count FROM equipment"
+_SUM_VALUE_SQL = "SELECT SUM(current_value) as total FROM equipment"
+_BY_DEPARTMENT_SQL = """
+    SELECT department, COUNT(*) as count
+    FROM equipment
+    GROUP BY department
+    ORDER BY count DESC
+"""
+_BY_STATUS_SQL = "SELECT * FROM equipment WHERE status = ? ORDER BY name"
+_AUDIT_INSERT_SQL = """
+    INSERT INTO audit_log 
+    (action, equipment_id, user_query, agent_name, changes, success)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Columns added after the initial schema. SQLite can only add generated
+# columns as VIRTUAL via ALTER TABLE; new databases get them STORED.
+EQUIPMENT_COLUMN_MIGRATIONS = {
+    "depreciation_amount": (
+        "ALTER TABLE equipment ADD COLUMN depreciation_amount REAL "
+        "GENERATED ALWAYS AS (purchase_price - current_value) VIRTUAL"
+    ),
+}
+
 
 class DatabaseManager:
     """Manages SQLite database connections and operations."""
@@ -22,33 +74,164 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Pool of long-lived read-only connections shared across threads
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_pool_size = 0
+        self._pool_lock = threading.Lock()
+        self._prepared = False
+        
+        # Single long-lived read-write connection; SQLite allows one writer
+        # at a time anyway, so writes are serialized on this lock
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        
+        # Bumped after every committed write; callers caching query results
+        # include it in their cache keys so a write makes old entries unreachable
+        self.write_version = 0
+        
+        # Whole-table aggregates keyed by helper name and write version
+        self._aggregate_cache = TTLCache(maxsize=16, ttl=AGGREGATE_CACHE_TTL)
+    
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply per-connection performance pragmas."""
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections.
+        """Context manager for the shared read-write connection.
+        
+        The connection stays open between calls and is held exclusively for
+        the duration of the block, which is committed on success and rolled
+        back on error.
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        with self._write_lock:
+            if self._write_conn is None:
+                conn = sqlite3.connect(
+                    self.db_path,
+                    check_same_thread=False,
+                    cached_statements=STATEMENT_CACHE_SIZE,
+                )
+                conn.row_factory = sqlite3.Row  # Enable column access by name
+                self._configure_connection(conn)
+                self._write_conn = conn
+            conn = self._write_conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
+    
+    @contextmanager
+    def _read_connection(self):
+        """Borrow a read-only connection from the pool.
+        
+        Pooled connections stay open, so SQLite's statement cache reuses
+        prepared statements across calls instead of re-parsing the SQL.
+        
+        Yields:
+            sqlite3.Connection: Read-only database connection
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_read_connection()
         try:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
         finally:
-            conn.close()
+            self._read_pool.put(conn)
+    
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """Open a new pooled read connection, or wait for one if the pool is full."""
+        with self._pool_lock:
+            if not self._prepared:
+                self._prepare_database()
+            can_open = self._read_pool_size < READ_POOL_SIZE
+            if can_open:
+                self._read_pool_size += 1
+        
+        if not can_open:
+            return self._read_pool.get()
+        
+        try:
+            conn = sqlite3.connect(
+                self.db_path.resolve().as_uri() + "?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+        except Exception:
+            with self._pool_lock:
+                self._read_pool_size -= 1
+            raise
+        return conn
+    
+    def _prepare_database(self) -> None:
+        """Enable WAL journaling and migrate existing databases (runs once)."""
+        with self.get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if not self._migrate_schema(conn):
+                return
+        self._prepared = True
+    
+    def _migrate_schema(self, conn: sqlite3.Connection) -> bool:
+        """Bring an existing database up to date with schema.sql.
+        
+        Adds missing columns, then re-applies the idempotent schema so new
+        indexes, tables and triggers are created. Planner statistics are
+        refreshed when indexes were added.
+        
+        Args:
+            conn: Open read-write database connection
+            
+        Returns:
+            True if the schema is current, False if the database is uninitialized
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(equipment)")}
+        if not columns:
+            # Equipment table does not exist yet; initialize_database creates it
+            return False
+        
+        for column, ddl in EQUIPMENT_COLUMN_MIGRATIONS.items():
+            if column not in columns:
+                conn.execute(ddl)
+        
+        index_count_sql = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'"
+        indexes_before = conn.execute(index_count_sql).fetchone()[0]
+        conn.executescript(SCHEMA_PATH.read_text())
+        if conn.execute(index_count_sql).fetchone()[0] != indexes_before:
+            conn.execute("ANALYZE equipment")
+        return True
+    
+    def close(self) -> None:
+        """Close the pooled read connections and the shared write connection."""
+        with self._pool_lock:
+            while True:
+                try:
+                    self._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._read_pool_size = 0
+        
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
     
     def initialize_database(self) -> None:
         """Initialize database with schema from schema.sql."""
-        schema_path = Path(__file__).parent / "schema.sql"
-        
-        with open(schema_path, 'r') as f:
+        with open(SCHEMA_PATH, 'r') as f:
             schema_sql = f.read()
         
         with self.get_connection() as conn:
             conn.executescript(schema_sql)
+            conn.execute("PRAGMA journal_mode=WAL")
         
         print(f"✓ Database initialized at {self.db_path}")
     
@@ -66,10 +249,55 @@ class DatabaseManager:
         Returns:
             List of dictionaries representing rows
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, params or ())
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        columns, rows = self.execute_query_tuples(query, params)
+        return [dict(zip(columns, row)) for row in rows]
+    
+    def execute_query_rows(
+        self,
+        query: str,
+        params: Optional[tuple] = None
+    ) -> List[sqlite3.Row]:
+        """Execute a SELECT query and return the rows as sqlite3.Row objects.
+        
+        Rows support access by column name (row["col"]) without being copied
+        into a dict, so prefer this over execute_query when callers only index
+        into the results.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            
+        Returns:
+            List of sqlite3.Row objects
+        """
+        with self._read_connection() as conn:
+            return conn.execute(query, params or ()).fetchall()
+    
+    def execute_query_tuples(
+        self,
+        query: str,
+        params: Optional[tuple] = None
+    ) -> Tuple[List[str], List[tuple]]:
+        """Execute a SELECT query and return column names and raw tuple rows.
+        
+        Avoids building a mapping per row, which matters for larger result sets.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            
+        Returns:
+            Tuple of (column_names, rows)
+        """
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            try:
+                cursor.execute(query, params or ())
+                columns = [description[0] for description in cursor.description]
+                return columns, cursor.fetchall()
+            finally:
+                cursor.close()
     
     def execute_update(
         self, 
@@ -86,8 +314,9 @@ class DatabaseManager:
             Number of affected rows
         """
         with self.get_connection() as conn:
-            cursor = conn.execute(query, params or ())
-            return cursor.rowcount
+            rowcount = conn.execute(query, params or ()).rowcount
+        self._record_write()
+        return rowcount
     
     def execute_many(
         self, 
@@ -104,32 +333,46 @@ class DatabaseManager:
             Number of affected rows
         """
         with self.get_connection() as conn:
-            cursor = conn.executemany(query, params_list)
-            return cursor.rowcount
+            rowcount = conn.executemany(query, params_list).rowcount
+        self._record_write()
+        return rowcount
+    
+    def _record_write(self) -> None:
+        """Mark cached query results stale after a committed write."""
+        with self._write_lock:
+            self.write_version += 1
+        self._aggregate_cache.clear()
     
     def get_equipment_count(self) -> int:
         """Get total count of equipment items."""
-        result = self.execute_query("SELECT COUNT(*) as count FROM equipment")
-        return result[0]['count'] if result else 0
+        key = ("equipment_count", self.write_version)
+        count = self._aggregate_cache.get(key)
+        if count is None:
+            result = self.execute_query_rows(_COUNT_SQL)
+            count = result[0]['count'] if result else 0
+            self._aggregate_cache.set(key, count)
+        return count
     
-    def get_equipment_by_department(self) -> List[Dict[str, Any]]:
+    def get_equipment_by_department(self) -> List[sqlite3.Row]:
         """Get equipment count by department."""
-        query = """
-            SELECT department, COUNT(*) as count
-            FROM equipment
-            GROUP BY department
-            ORDER BY count DESC
-        """
-        return self.execute_query(query)
+        key = ("equipment_by_department", self.write_version)
+        rows = self._aggregate_cache.get(key)
+        if rows is None:
+            rows = self.execute_query_rows(_BY_DEPARTMENT_SQL)
+            self._aggregate_cache.set(key, rows)
+        return list(rows)
     
     def get_total_equipment_value(self) -> float:
         """Get total current value of all equipment."""
-        result = self.execute_query(
-            "SELECT SUM(current_value) as total FROM equipment"
-        )
-        return result[0]['total'] if result and result[0]['total'] else 0.0
+        key = ("total_equipment_value", self.write_version)
+        total = self._aggregate_cache.get(key)
+        if total is None:
+            result = self.execute_query_rows(_SUM_VALUE_SQL)
+            total = result[0]['total'] if result and result[0]['total'] else 0.0
+            self._aggregate_cache.set(key, total)
+        return total
     
-    def get_equipment_by_status(self, status: str) -> List[Dict[str, Any]]:
+    def get_equipment_by_status(self, status: str) -> List[sqlite3.Row]:
         """Get equipment filtered by status.
         
         Args:
@@ -138,8 +381,7 @@ class DatabaseManager:
         Returns:
             List of equipment records
         """
-        query = "SELECT * FROM equipment WHERE status = ? ORDER BY name"
-        return self.execute_query(query, (status,))
+        return self.execute_query_rows(_BY_STATUS_SQL, (status,))
     
     def log_audit(
         self,
@@ -160,15 +402,12 @@ class DatabaseManager:
             changes: Description of changes made
             success: Whether the action succeeded
         """
-        query = """
-            INSERT INTO audit_log 
-            (action, equipment_id, user_query, agent_name, changes, success)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """
-        self.execute_update(
-            query, 
-            (action, equipment_id, user_query, agent_name, changes, success)
-        )
+        # Audit rows never touch equipment, so cached aggregates stay valid
+        with self.get_connection() as conn:
+            conn.execute(
+                _AUDIT_INSERT_SQL,
+                (action, equipment_id, user_query, agent_name, changes, success)
+            )
 
 
 # Global database manager instance
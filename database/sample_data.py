@@ -6,7 +6,8 @@ Creates 2000 equipment items across 6 categories with realistic business data.
 
 import random
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from itertools import accumulate, islice
+from typing import Iterator, Optional, Tuple
 from database.db_manager import db_manager
 
 
@@ -140,10 +141,14 @@ EMPLOYEES = [
     "Richard Martin", "Linda Thompson", "Joseph Garcia", "Barbara Rodriguez"
 ]
 
-
-def generate_serial_number() -> str:
-    """Generate a realistic serial number."""
-    return f"SN{random.randint(100000, 999999)}"
+# Cumulative weights and candidate pools for bulk sampling with
+# random.choices(..., k=n), computed once instead of per draw
+_STATUS_CUM_WEIGHTS = list(accumulate(STATUS_WEIGHTS))
+_CONDITION_CUM_WEIGHTS = list(accumulate(CONDITION_WEIGHTS))
+_ASSIGNEES = EMPLOYEES + [None, None]  # Some unassigned
+_AGES = tuple(timedelta(days=days) for days in range(30, 1826))  # 1 month to 5 years old
+_SERIAL_RANGE = range(100000, 1000000)
+_WARRANTY_TERMS = tuple(timedelta(days=365 * years) for years in (1, 2, 3))
 
 
 def generate_asset_tag(index: int) -> str:
@@ -154,10 +159,13 @@ def generate_asset_tag(index: int) -> str:
 def calculate_current_value(
     purchase_price: float,
     purchase_date: datetime,
-    depreciation_rate: float
+    depreciation_rate: float,
+    now: Optional[datetime] = None
 ) -> float:
-    """Calculate current value based on depreciation."""
-    years_old = (datetime.now() - purchase_date).days / 365.25
+    """Calculate current value based on depreciation as of now."""
+    if now is None:
+        now = datetime.now()
+    years_old = (now - purchase_date).days / 365.25
     depreciation = purchase_price * depreciation_rate * years_old
     current_value = max(purchase_price - depreciation, purchase_price * 0.1)
     return round(current_value, 2)
@@ -165,17 +173,21 @@ def calculate_current_value(
 
 def generate_maintenance_dates(
     purchase_date: datetime,
-    status: str
+    status: str,
+    now: Optional[datetime] = None
 ) -> Tuple[datetime, datetime, int]:
-    """Generate maintenance dates based on equipment age and status."""
+    """Generate maintenance dates based on equipment age and status as of now."""
+    if now is None:
+        now = datetime.now()
+    
     # Maintenance interval in days (90-365 days)
     interval = random.randint(90, 365)
     
     # Last maintenance: sometime between purchase and now
-    days_since_purchase = (datetime.now() - purchase_date).days
+    days_since_purchase = (now - purchase_date).days
     if days_since_purchase > 0:
         last_maintenance_days_ago = random.randint(0, min(days_since_purchase, 180))
-        last_maintenance = datetime.now() - timedelta(days=last_maintenance_days_ago)
+        last_maintenance = now - timedelta(days=last_maintenance_days_ago)
     else:
         last_maintenance = purchase_date
     
@@ -188,56 +200,66 @@ def generate_maintenance_dates(
     return last_maintenance, next_maintenance, interval
 
 
-def generate_equipment_records(count: int = 2000) -> List[Tuple]:
+def generate_equipment_records(count: int = 2000) -> Iterator[Tuple]:
     """Generate realistic equipment records.
     
+    Records are yielded one at a time, so callers can consume them in
+    batches without holding the whole data set in memory.
+    
     Args:
         count: Number of equipment items to generate
         
-    Returns:
-        List of tuples ready for database insertion
+    Yields:
+        Tuples ready for database insertion
     """
-    records = []
     items_per_category = count // len(EQUIPMENT_DATA)
     
+    # One reference time for every record instead of a clock read per row
+    now = datetime.now()
+    
     record_index = 1
     
     for category, cat_data in EQUIPMENT_DATA.items():
         items = cat_data["items"]
         price_min, price_max = cat_data["price_range"]
         depreciation_rate = cat_data["depreciation"]
+        n = items_per_category
         
-        for _ in range(items_per_category):
-            # Select random item from category
-            name, manufacturer, model = random.choice(items)
-            
+        # Draw each random column for the whole category at once
+        picked_items = random.choices(items, k=n)
+        age_column = random.choices(_AGES, k=n)
+        price_column = [round(random.uniform(price_min, price_max), 2) for _ in range(n)]
+        department_column = random.choices(DEPARTMENTS, k=n)
+        location_column = random.choices(LOCATIONS, k=n)
+        assignee_column = random.choices(_ASSIGNEES, k=n)
+        status_column = random.choices(STATUSES, cum_weights=_STATUS_CUM_WEIGHTS, k=n)
+        condition_column = random.choices(CONDITIONS, cum_weights=_CONDITION_CUM_WEIGHTS, k=n)
+        warranty_column = random.choices(_WARRANTY_TERMS, k=n)
+        serial_column = random.choices(_SERIAL_RANGE, k=n)
+        
+        for (
+            (name, manufacturer, model), age, purchase_price, department,
+            location, assigned_to, status, condition, warranty_term, serial
+        ) in zip(
+            picked_items, age_column, price_column, department_column,
+            location_column, assignee_column, status_column, condition_column,
+            warranty_column, serial_column
+        ):
             # Generate dates
-            days_ago = random.randint(30, 1825)  # 1 month to 5 years old
-            purchase_date = datetime.now() - timedelta(days=days_ago)
+            purchase_date = now - age
             
             # Financial data
-            purchase_price = round(random.uniform(price_min, price_max), 2)
             current_value = calculate_current_value(
-                purchase_price, purchase_date, depreciation_rate
+                purchase_price, purchase_date, depreciation_rate, now
             )
             
-            # Location and assignment
-            department = random.choice(DEPARTMENTS)
-            location = random.choice(LOCATIONS)
-            assigned_to = random.choice(EMPLOYEES + [None, None])  # Some unassigned
-            
-            # Status and condition
-            status = random.choices(STATUSES, weights=STATUS_WEIGHTS)[0]
-            condition = random.choices(CONDITIONS, weights=CONDITION_WEIGHTS)[0]
-            
             # Maintenance dates
             last_maint, next_maint, interval = generate_maintenance_dates(
-                purchase_date, status
+                purchase_date, status, now
             )
             
             # Warranty (1-3 years from purchase)
-            warranty_years = random.choice([1, 2, 3])
-            warranty_expiry = purchase_date + timedelta(days=365 * warranty_years)
+            warranty_expiry = purchase_date + warranty_term
             
             # Create record tuple
             record = (
@@ -246,7 +268,7 @@ def generate_equipment_records(count: int = 2000) -> List[Tuple]:
                 category,  # category
                 manufacturer,  # manufacturer
                 model,  # model_number
-                generate_serial_number(),  # serial_number
+                f"SN{serial}",  # serial_number
                 purchase_date.date(),  # purchase_date
                 purchase_price,  # purchase_price
                 current_value,  # current_value
@@ -263,17 +285,16 @@ def generate_equipment_records(count: int = 2000) -> List[Tuple]:
                 None  # notes
             )
             
-            records.append(record)
+            yield record
             record_index += 1
-    
-    return records
 
 
-def populate_database(count: int = 2000) -> None:
+def populate_database(count: int = 2000, batch_size: int = 10_000) -> None:
     """Generate and insert sample equipment data into database.
     
     Args:
         count: Number of equipment items to generate
+        batch_size: Maximum number of rows inserted per transaction
     """
     print(f"Generating {count} equipment records...")
     records = generate_equipment_records(count)
@@ -289,9 +310,35 @@ def populate_database(count: int = 2000) -> None:
     """
     
     print("Inserting records into database...")
-    affected = db_manager.execute_many(insert_query, records)
+    # Secondary indexes are rebuilt once over the loaded rows instead of being
+    # updated per insert; the definitions come from the live schema
+    indexes = db_manager.execute_query_tuples(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'equipment' AND sql IS NOT NULL"
+    )[1]
+    for index_name, _ in indexes:
+        db_manager.execute_update(f'DROP INDEX IF EXISTS "{index_name}"')
+    db_manager.execute_update("PRAGMA synchronous=OFF")
+    
+    try:
+        # Records are generated as they are inserted, and each execute_many
+        # call commits its own transaction, so both memory and transaction
+        # size stay bounded by batch_size
+        affected = 0
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            affected += db_manager.execute_many(insert_query, batch)
+    finally:
+        db_manager.execute_update("PRAGMA synchronous=NORMAL")
+        for _, index_sql in indexes:
+            db_manager.execute_update(index_sql)
     print(f"✓ Successfully inserted {affected} equipment records")
     
+    # Refresh query planner statistics for the freshly loaded data
+    db_manager.execute_update("ANALYZE equipment")
+    
     # Print summary statistics
     print("\n=== Database Summary ===")
     print(f"Total Equipment: {db_manager.get_equipment_count()}")
@@ -15,6 +15,7 @@ CREATE TABLE IF NOT EXISTS equipment (
     purchase_price REAL,
     current_value REAL,
     depreciation_rate REAL,
+    depreciation_amount REAL GENERATED ALWAYS AS (purchase_price - current_value) STORED,
     -- Location & Assignment
     department TEXT NOT NULL,
     location TEXT,
@@ -37,6 +38,47 @@ CREATE INDEX IF NOT EXISTS idx_status ON equipment(status);
 CREATE INDEX IF NOT EXISTS idx_category ON equipment(category);
 CREATE INDEX IF NOT EXISTS idx_next_maintenance ON equipment(next_maintenance_date);
 CREATE INDEX IF NOT EXISTS idx_asset_tag ON equipment(asset_tag);
+CREATE INDEX IF NOT EXISTS idx_name ON equipment(name);
+CREATE INDEX IF NOT EXISTS idx_status_name ON equipment(status, name);
+CREATE INDEX IF NOT EXISTS idx_filter_cover ON equipment(category, department, status, condition, current_value);
+-- Inventory Summary Table
+-- Single-row running totals maintained by triggers so headline metrics
+-- are point lookups instead of full-table aggregates
+CREATE TABLE IF NOT EXISTS equipment_summary (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    item_count INTEGER NOT NULL DEFAULT 0,
+    total_value REAL NOT NULL DEFAULT 0,
+    total_depreciation REAL NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO equipment_summary (id, item_count, total_value, total_depreciation)
+SELECT 1, COUNT(*), COALESCE(SUM(current_value), 0), COALESCE(SUM(purchase_price - current_value), 0)
+FROM equipment;
+CREATE TRIGGER IF NOT EXISTS trg_equipment_summary_insert AFTER INSERT ON equipment
+BEGIN
+    UPDATE equipment_summary SET
+        item_count = item_count + 1,
+        total_value = total_value + COALESCE(NEW.current_value, 0),
+        total_depreciation = total_depreciation + COALESCE(NEW.purchase_price - NEW.current_value, 0)
+    WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_equipment_summary_delete AFTER DELETE ON equipment
+BEGIN
+    UPDATE equipment_summary SET
+        item_count = item_count - 1,
+        total_value = total_value - COALESCE(OLD.current_value, 0),
+        total_depreciation = total_depreciation - COALESCE(OLD.purchase_price - OLD.current_value, 0)
+    WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_equipment_summary_update
+AFTER UPDATE OF purchase_price, current_value ON equipment
+BEGIN
+    UPDATE equipment_summary SET
+        total_value = total_value - COALESCE(OLD.current_value, 0) + COALESCE(NEW.current_value, 0),
+        total_depreciation = total_depreciation
+            - COALESCE(OLD.purchase_price - OLD.current_value, 0)
+            + COALESCE(NEW.purchase_price - NEW.current_value, 0)
+    WHERE id = 1;
+END;
 -- Maintenance Log Table
 CREATE TABLE IF NOT EXISTS maintenance_log (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
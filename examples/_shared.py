@@ -0,0 +1,139 @@
+"""
+Shared sample data and layout for the comprehensive theme demos.
+
+The comprehensive, dark and ocean demos show the same dashboard under
+different themes; they build it from here and differ only in their titles
+and theme.
+"""
+
+import pandas as pd
+import numpy as np
+import streamlit as st
+from datetime import datetime
+
+from core.specs import DashboardSpec, WidgetSpec, WidgetType
+
+
+# One explicit generator for all sample draws
+rng = np.random.default_rng()
+
+
+# Generate sample data once; Streamlit reruns reuse the cached frames
+@st.cache_data(show_spinner=False)
+def generate_sample_data():
+    """Generate comprehensive sample data for all widget types."""
+    
+    # Time series data (30 days)
+    dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
+    sales_data = pd.DataFrame({
+        'date': dates,
+        'sales': rng.integers(15000, 35000, 30),
+        'revenue': rng.integers(50000, 100000, 30),
+    })
+    
+    # Category data for bar chart
+    category_data = pd.DataFrame({
+        'category': ['Electronics', 'Clothing', 'Food', 'Books', 'Home'],
+        'sales': [45000, 32000, 28000, 15000, 22000]
+    })
+    
+    # Product performance table
+    product_data = pd.DataFrame({
+        'Product': ['Laptop', 'Phone', 'Tablet', 'Headphones', 'Watch'],
+        'Units Sold': [1250, 2340, 890, 3200, 1560],
+        'Revenue': ['$1.25M', '$2.34M', '$890K', '$320K', '$1.56M'],
+        'Growth': ['+12%', '+8%', '-3%', '+25%', '+15%']
+    })
+    
+    return sales_data, category_data, product_data
+
+
+def build_comprehensive_dashboard(
+    dashboard_id: str,
+    title: str,
+    description: str
+) -> DashboardSpec:
+    """
+    Build the dashboard showing every widget type over the sample data.
+    
+    Args:
+        dashboard_id: Unique identifier for the dashboard
+        title: Display title
+        description: Dashboard description
+        
+    Returns:
+        Dashboard specification
+    """
+    sales_data, category_data, product_data = generate_sample_data()
+    
+    # Calculate metrics for scorecards
+    total_sales = sales_data['sales'].sum()
+    total_revenue = sales_data['revenue'].sum()
+    avg_daily_sales = sales_data['sales'].mean()
+    
+    return DashboardSpec(
+        dashboard_id=dashboard_id,
+        title=title,
+        description=description,
+        layout={
+            "type": "grid",
+            "columns": 3,
+            "gap": "medium"
+        },
+        widgets=[
+            # Row 1: Scorecards
+            WidgetSpec(
+                widget_id="total_sales",
+                widget_type=WidgetType.SCORECARD,
+                title="Total Sales (30 days)",
+                data={"value": total_sales},
+                config={"number_format": "auto"}
+            ),
+            WidgetSpec(
+                widget_id="total_revenue",
+                widget_type=WidgetType.SCORECARD,
+                title="Total Revenue",
+                data={"value": total_revenue},
+                config={"number_format": "auto"}
+            ),
+            WidgetSpec(
+                widget_id="avg_daily_sales",
+                widget_type=WidgetType.SCORECARD,
+                title="Avg Daily Sales",
+                data={"value": avg_daily_sales},
+                config={"number_format": "auto"}
+            ),
+            
+            # Row 2: Time Series Charts
+            WidgetSpec(
+                widget_id="sales_trend",
+                widget_type=WidgetType.TIME_SERIES,
+                title="Daily Sales Trend",
+                data=sales_data,  # Pass full dataframe
+                config={"show_legend": True}
+            ),
+            WidgetSpec(
+                widget_id="revenue_trend",
+                widget_type=WidgetType.TIME_SERIES,
+                title="Daily Revenue Trend",
+                data=sales_data[['date', 'revenue']],  # Only date and revenue
+                config={"show_legend": True}
+            ),
+            
+            # Row 3: Bar chart and Table
+            WidgetSpec(
+                widget_id="category_sales",
+                widget_type=WidgetType.BAR_CHART,
+                title="Sales by Category",
+                data=category_data,
+                config={"show_legend": False}
+            ),
+            WidgetSpec(
+                widget_id="product_performance",
+                widget_type=WidgetType.TABLE,
+                title="Top Products Performance",
+                data=product_data,
+                config={}
+            ),
+        ]
+    )
@@ -7,18 +7,29 @@ Simply change the theme parameter to switch between themes.
 
 import pandas as pd
 import numpy as np
+import streamlit as st
 from datetime import datetime
 
 from api import create_dashboard
 from core.specs import DashboardSpec, WidgetSpec, WidgetType
 
 
-# Generate sample data
-dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
-sales_data = pd.DataFrame({
-    'date': dates,
-    'sales': np.random.randint(15000, 35000, 30),
-})
+# One explicit generator for all sample draws
+rng = np.random.default_rng()
+
+
+# Generate sample data once; Streamlit reruns reuse the cached frame
+@st.cache_data(show_spinner=False)
+def generate_sample_data():
+    """Generate 30 days of random daily sales."""
+    dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
+    return pd.DataFrame({
+        'date': dates,
+        'sales': rng.integers(15000, 35000, 30),
+    })
+
+
+sales_data = generate_sample_data()
 
 total_sales = sales_data['sales'].sum()
 avg_sales = sales_data['sales'].mean()
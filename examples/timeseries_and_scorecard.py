@@ -9,14 +9,16 @@ This demonstrates:
 """
 
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from core.specs import DashboardSpec, WidgetSpec, WidgetType
 from api import create_dashboard
 
 
 # Generate sample time series data (daily sales for last 30 days)
-dates = [datetime.now() - timedelta(days=i) for i in range(30, 0, -1)]
-sales = [15000 + (i * 500) + (i % 7) * 1000 for i in range(30)]  # Trending up with weekly pattern
+dates = pd.date_range(end=datetime.now() - timedelta(days=1), periods=30, freq='D')
+days = np.arange(30)
+sales = 15000 + days * 500 + (days % 7) * 1000  # Trending up with weekly pattern
 
 sales_data = pd.DataFrame({
     'date': dates,
@@ -12,8 +12,25 @@ from themes.base import (
     OCEAN_THEME,
     THEMES,
 )
-from themes.css_builder import CSSBuilder
-from themes.html_builders import HTMLCardBuilder, HTMLTableBuilder
+
+# Builders are imported on first access (PEP 562); html_builders pulls in
+# pandas, which callers that only need themes should not pay for
+_LAZY_BUILDERS = {
+    "CSSBuilder": "themes.css_builder",
+    "HTMLCardBuilder": "themes.html_builders",
+    "HTMLTableBuilder": "themes.html_builders",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_BUILDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "Theme",
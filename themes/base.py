@@ -4,11 +4,13 @@ Theme system for dynamic dashboards.
 This module provides theme configurations for consistent styling across dashboards.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThemeColors:
     """Color palette for a theme."""
     # Background colors
@@ -34,7 +36,7 @@ class ThemeColors:
     negative: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThemeTypography:
     """Typography settings for a theme."""
     font_family: str
@@ -52,7 +54,7 @@ class ThemeTypography:
     body_weight: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThemeSpacing:
     """Spacing settings for a theme."""
     card_padding: str
@@ -63,7 +65,8 @@ class ThemeSpacing:
     card_shadow: str
 
 
-@dataclass
+# Theme keeps its __dict__ so the cached as_dict property has somewhere to live
+@dataclass(frozen=True)
 class Theme:
     """Complete theme configuration."""
     name: str
@@ -71,13 +74,14 @@ class Theme:
     typography: ThemeTypography
     spacing: ThemeSpacing
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert theme to dictionary for easy access."""
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Theme as a dictionary for easy access, built once per theme."""
         return {
             "name": self.name,
-            "colors": self.colors.__dict__,
-            "typography": self.typography.__dict__,
-            "spacing": self.spacing.__dict__,
+            "colors": asdict(self.colors),
+            "typography": asdict(self.typography),
+            "spacing": asdict(self.spacing),
         }
 
 
@@ -192,13 +196,16 @@ OCEAN_THEME = Theme(
 )
 
 
-# Registry of available themes
-THEMES: Dict[str, Theme] = {
+# Registry of available themes; only register_theme adds to it
+_THEMES: Dict[str, Theme] = {
     "professional": PROFESSIONAL_THEME,
     "dark": DARK_THEME,
     "ocean": OCEAN_THEME,
 }
 
+# Read-only view of the registry for lookups
+THEMES: Mapping[str, Theme] = MappingProxyType(_THEMES)
+
 
 def get_theme(name: str = "professional") -> Theme:
     """
@@ -213,9 +220,10 @@ def get_theme(name: str = "professional") -> Theme:
     Raises:
         ValueError: If theme name is not found
     """
-    if name not in THEMES:
+    theme = THEMES.get(name)
+    if theme is None:
         raise ValueError(f"Theme '{name}' not found. Available themes: {list(THEMES.keys())}")
-    return THEMES[name]
+    return theme
 
 
 def register_theme(theme: Theme) -> None:
@@ -225,4 +233,4 @@ def register_theme(theme: Theme) -> None:
     Args:
         theme: Theme configuration to register
     """
-    THEMES[theme.name] = theme
+    _THEMES[theme.name] = theme
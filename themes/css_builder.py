@@ -5,10 +5,65 @@ This module converts theme data into CSS strings, separating styling logic
 from rendering logic.
 """
 
-from typing import Dict
+import re
+from typing import Callable, Dict, Tuple
 from themes.base import Theme
 
 
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+# Quoted strings (e.g. attribute selector values) are matched first and kept as-is
+_CSS_PUNCTUATION_RE = re.compile(r"(\"[^\"]*\"|'[^']*')|\s*([{};:,>])\s*")
+
+
+# Rendered CSS per theme name, stored with the theme it was rendered from so
+# a re-registered theme of the same name is rendered afresh
+_GLOBAL_CSS_CACHE: Dict[str, Tuple[Theme, str]] = {}
+_DATAFRAME_CSS_CACHE: Dict[str, Tuple[Theme, str]] = {}
+_CARD_CSS_CACHE: Dict[str, Tuple[Theme, str]] = {}
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a CSS (or style block) string.
+    
+    Streamlit re-sends every style block on each rerun, so the shipped CSS is
+    kept compact while the templates stay readable.
+    
+    Args:
+        css: CSS string, optionally wrapped in a <style> tag
+        
+    Returns:
+        Minified CSS string
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    return _CSS_PUNCTUATION_RE.sub(lambda m: m.group(1) or m.group(2), css).strip()
+
+
+def _cached_css(
+    cache: Dict[str, Tuple[Theme, str]],
+    theme: Theme,
+    render: Callable[[], str]
+) -> str:
+    """
+    Return the CSS cached for a theme, rendering and minifying it on first use.
+    
+    Args:
+        cache: Cache to look up and fill
+        theme: Theme the CSS is rendered from
+        render: Builds the CSS string on a cache miss
+        
+    Returns:
+        Rendered CSS string
+    """
+    entry = cache.get(theme.name)
+    if entry is None or entry[0] is not theme:
+        entry = (theme, minify_css(render()))
+        cache[theme.name] = entry
+    return entry[1]
+
+
 class CSSBuilder:
     """
     Builds CSS from theme configuration.
@@ -33,9 +88,16 @@ class CSSBuilder:
         """
         Build global CSS for the entire dashboard.
         
+        The result is cached per theme, so later builders for the same theme
+        skip rendering.
+        
         Returns:
             CSS string with global styles
         """
+        return _cached_css(_GLOBAL_CSS_CACHE, self.theme, self._render_global_css)
+    
+    def _render_global_css(self) -> str:
+        """Render the global CSS string for this builder's theme."""
         return f"""
             <style>
             /* Main container styling */
@@ -79,6 +141,8 @@ class CSSBuilder:
             
             {self.build_dataframe_css()}
             
+            {self.build_card_css()}
+            
             /* Remove default Streamlit padding */
             .element-container {{
                 margin-bottom: 0;
@@ -93,23 +157,29 @@ class CSSBuilder:
         Returns:
             CSS string for dataframe styling
         """
+        return _cached_css(_DATAFRAME_CSS_CACHE, self.theme, self._render_dataframe_css)
+    
+    def _render_dataframe_css(self) -> str:
+        """Render the dataframe CSS string for this builder's theme."""
         return f"""
-            /* Dataframe styling for theme consistency */
+            /* Dataframe styling for theme consistency; HTML tables from
+               HTMLTableBuilder also carry pandas' dataframe class but are
+               styled by the themed-table rules instead */
             [data-testid="stDataFrame"] {{
                 background-color: {self.colors.card_background} !important;
             }}
             
-            .dataframe {{
+            .dataframe:not(.themed-table) {{
                 background-color: {self.colors.card_background} !important;
                 color: {self.colors.text_primary} !important;
                 border: 1px solid {self.colors.border} !important;
             }}
             
-            .dataframe thead tr {{
+            .dataframe:not(.themed-table) thead tr {{
                 background-color: {self.colors.card_background} !important;
             }}
             
-            .dataframe thead th {{
+            .dataframe:not(.themed-table) thead th {{
                 background-color: {self.colors.card_background} !important;
                 color: {self.colors.text_secondary} !important;
                 font-weight: 600 !important;
@@ -117,16 +187,16 @@ class CSSBuilder:
                 padding: 12px !important;
             }}
             
-            .dataframe tbody tr {{
+            .dataframe:not(.themed-table) tbody tr {{
                 background-color: {self.colors.card_background} !important;
                 border-bottom: 1px solid {self.colors.border} !important;
             }}
             
-            .dataframe tbody tr:hover {{
+            .dataframe:not(.themed-table) tbody tr:hover {{
                 background-color: {self.colors.background} !important;
             }}
             
-            .dataframe tbody td {{
+            .dataframe:not(.themed-table) tbody td {{
                 color: {self.colors.text_primary} !important;
                 padding: 10px 12px !important;
                 border-color: {self.colors.border} !important;
@@ -139,6 +209,92 @@ class CSSBuilder:
             }}
         """
     
+    def build_card_css(self) -> str:
+        """
+        Build CSS for the card, scorecard and table classes emitted by the
+        HTML builders.
+        
+        Returns:
+            CSS string for themed card styling
+        """
+        return _cached_css(_CARD_CSS_CACHE, self.theme, self._render_card_css)
+    
+    def _render_card_css(self) -> str:
+        """Render the card CSS string for this builder's theme."""
+        return f"""
+            /* Themed cards */
+            .themed-card {{
+                background: {self.colors.card_background};
+                border: 1px solid {self.colors.border};
+                border-radius: {self.spacing.card_border_radius};
+                padding: {self.spacing.card_padding};
+                box-shadow: {self.spacing.card_shadow};
+                margin-bottom: {self.spacing.card_margin};
+            }}
+            
+            .themed-card-title {{
+                font-size: {self.typography.subtitle_size};
+                font-weight: {self.typography.subtitle_weight};
+                color: {self.colors.text_primary};
+                margin-bottom: 16px;
+            }}
+            
+            /* Scorecards */
+            .themed-scorecard {{
+                height: 100%;
+            }}
+            
+            .themed-scorecard-title {{
+                font-size: {self.typography.caption_size};
+                font-weight: {self.typography.subtitle_weight};
+                color: {self.colors.text_muted};
+                text-transform: uppercase;
+                letter-spacing: 0.5px;
+                margin-bottom: 12px;
+            }}
+            
+            .themed-scorecard-value {{
+                font-size: {self.typography.metric_size};
+                font-weight: {self.typography.title_weight};
+                color: {self.colors.text_primary};
+                line-height: 1;
+            }}
+            
+            /* HTML tables */
+            .themed-table-container {{
+                overflow-x: auto;
+                max-height: 400px;
+                overflow-y: auto;
+            }}
+            
+            .themed-table {{
+                width: 100%;
+                border-collapse: collapse;
+                border: none;
+                font-size: {self.typography.body_size};
+            }}
+            
+            .themed-table thead tr {{
+                border-bottom: 2px solid {self.colors.border};
+            }}
+            
+            .themed-table th {{
+                text-align: left;
+                padding: 12px;
+                color: {self.colors.text_secondary};
+                font-weight: 600;
+            }}
+            
+            .themed-table tbody tr {{
+                border-bottom: 1px solid {self.colors.border};
+            }}
+            
+            .themed-table td {{
+                padding: 10px 12px;
+                color: {self.colors.text_primary};
+            }}
+        """
+    
     def get_card_styles(self) -> Dict[str, str]:
         """
         Get card wrapper styles as a dictionary.
@@ -31,6 +31,8 @@ class HTMLCardBuilder:
         """
         Build a themed scorecard HTML.
         
+        Styling comes from the classes defined in CSSBuilder.build_card_css.
+        
         Args:
             title: Scorecard title
             value: Formatted value to display
@@ -38,10 +40,12 @@ class HTMLCardBuilder:
         Returns:
             HTML string for scorecard
         """
-        return f'''<div style="background: {self.colors.card_background}; border: 1px solid {self.colors.border}; border-radius: {self.spacing.card_border_radius}; padding: {self.spacing.card_padding}; box-shadow: {self.spacing.card_shadow}; margin-bottom: {self.spacing.card_margin}; height: 100%;">
-<div style="font-size: {self.typography.caption_size}; font-weight: {self.typography.subtitle_weight}; color: {self.colors.text_muted}; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 12px;">{title}</div>
-<div style="font-size: {self.typography.metric_size}; font-weight: {self.typography.title_weight}; color: {self.colors.text_primary}; line-height: 1;">{value}</div>
-</div>'''
+        return (
+            f'<div class="themed-card themed-scorecard">'
+            f'<div class="themed-scorecard-title">{title}</div>'
+            f'<div class="themed-scorecard-value">{value}</div>'
+            f'</div>'
+        )
 
 
 class HTMLTableBuilder:
@@ -65,6 +69,8 @@ class HTMLTableBuilder:
         """
         Build a themed HTML table.
         
+        Styling comes from the classes defined in CSSBuilder.build_card_css.
+        
         Args:
             df: DataFrame to render
             title: Table title
@@ -72,37 +78,16 @@ class HTMLTableBuilder:
         Returns:
             HTML string for table
         """
-        # Build table headers
-        headers = ''.join(
-            f'<th style="text-align: left; padding: 12px; color: {self.colors.text_secondary}; font-weight: 600;">{col}</th>'
-            for col in df.columns
+        table = df.to_html(
+            index=False,
+            border=0,
+            classes="themed-table",
+            escape=True
         )
         
-        # Build table rows
-        rows = ''.join(
-            f'<tr style="border-bottom: 1px solid {self.colors.border};">' +
-            ''.join(f'<td style="padding: 10px 12px; color: {self.colors.text_primary};">{val}</td>' for val in row) +
-            '</tr>'
-            for row in df.values
+        return (
+            f'<div class="themed-card">'
+            f'<div class="themed-card-title">{title}</div>'
+            f'<div class="themed-table-container">{table}</div>'
+            f'</div>'
         )
-        
-        return f'''
-        <div style="background: {self.colors.card_background}; border: 1px solid {self.colors.border}; 
-                    border-radius: {self.spacing.card_border_radius}; padding: {self.spacing.card_padding}; 
-                    box-shadow: {self.spacing.card_shadow}; margin-bottom: {self.spacing.card_margin};">
-            <div style="font-size: {self.typography.subtitle_size}; font-weight: {self.typography.subtitle_weight}; 
-                        color: {self.colors.text_primary}; margin-bottom: 16px;">{title}</div>
-            <div style="overflow-x: auto; max-height: 400px; overflow-y: auto;">
-                <table style="width: 100%; border-collapse: collapse; font-size: {self.typography.body_size};">
-                    <thead>
-                        <tr style="border-bottom: 2px solid {self.colors.border};">
-                            {headers}
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {rows}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        '''
@@ -5,6 +5,34 @@ Centralizes all custom CSS styling for the Streamlit application.
 Separates presentation concerns from application logic.
 """
 
+from themes.css_builder import minify_css
+
+
+CUSTOM_CSS = minify_css("""
+    <style>
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Improve chat input styling */
+    .stTextInput > div > div > input {
+        border-radius: 20px;
+    }
+    
+    /* Improve button styling */
+    .stButton > button {
+        border-radius: 20px;
+        height: 38px;
+    }
+    
+    /* Reduce padding for better space usage */
+    .block-container {
+        padding-top: 2rem;
+        padding-bottom: 0rem;
+    }
+    </style>
+""")
+
 
 def get_custom_css() -> str:
     """
@@ -13,30 +41,7 @@ def get_custom_css() -> str:
     Returns:
         str: CSS styles as a string
     """
-    return """
-        <style>
-        /* Hide Streamlit branding */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        
-        /* Improve chat input styling */
-        .stTextInput > div > div > input {
-            border-radius: 20px;
-        }
-        
-        /* Improve button styling */
-        .stButton > button {
-            border-radius: 20px;
-            height: 38px;
-        }
-        
-        /* Reduce padding for better space usage */
-        .block-container {
-            padding-top: 2rem;
-            padding-bottom: 0rem;
-        }
-        </style>
-    """
+    return CUSTOM_CSS
 
 
 def apply_custom_styling() -> None:
@@ -9,6 +9,7 @@ import streamlit as st
 
 from chat_handler import process_user_message
 from dashboard_renderer import render_dashboard_widgets
+from themes.css_builder import minify_css
 from ui_styles import get_welcome_screen_html
 
 
@@ -23,6 +24,103 @@ INITIAL_WELCOME_MESSAGE = (
     "• 'What's our total depreciation?'"
 )
 
+GLOBAL_STYLE_HTML = minify_css("""
+    <style>
+    /* Import Google Fonts */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+    
+    /* Global styling */
+    * {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+    }
+    
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    
+    /* Main container */
+    .block-container {
+        padding-top: 0.5rem;
+        padding-bottom: 1rem;
+        max-width: 100%;
+    }
+    
+    /* Page background */
+    .main {
+        background-color: #f8f9fa;
+    }
+    
+    /* Column styling */
+    [data-testid="column"] {
+        background: white;
+        border-radius: 8px;
+        padding: 20px;
+        border: 1px solid #e5e7eb;
+        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
+    }
+    
+    /* Section headers */
+    h3 {
+        font-weight: 600;
+        font-size: 12px;
+        color: #6b7280;
+        margin-bottom: 0.75rem;
+        margin-top: 0;
+        padding-bottom: 0.5rem;
+        border-bottom: none;
+        text-transform: uppercase;
+        letter-spacing: 0.8px;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        border-radius: 6px;
+        font-weight: 600;
+        font-size: 13px;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border: none;
+        transition: all 0.2s;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-1px);
+        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Chat container adjustments */
+    [data-testid="stVerticalBlock"] > [style*="height: 500px"] {
+        border-radius: 6px;
+        border: 1px solid #e5e7eb;
+    }
+    </style>
+    """)
+
+HEADER_HTML = """
+    <div style="
+        background: white;
+        padding: 12px 0;
+        border-bottom: 2px solid #f1f5f9;
+        margin-bottom: 1.25rem;
+    ">
+        <span style="
+            color: #1f2937;
+            font-size: 16px;
+            font-weight: 600;
+            letter-spacing: -0.01em;
+        ">Equipment Inventory Assistant</span>
+        <span style="
+            color: #cbd5e0;
+            font-size: 14px;
+            margin: 0 10px;
+        ">|</span>
+        <span style="
+            color: #64748b;
+            font-size: 11px;
+        ">Ask questions in natural language</span>
+    </div>
+    """
+
 
 def initialize_session_state() -> None:
     """
@@ -44,6 +142,7 @@ def initialize_session_state() -> None:
         st.session_state.current_dashboard = None
 
 
+@st.fragment
 def render_chat_interface() -> None:
     """
     Render the chat interface with message history and input.
@@ -53,7 +152,8 @@ def render_chat_interface() -> None:
     - st.chat_message(): Native chat message bubbles with avatars
     - st.chat_input(): Sticky input at bottom with auto-submit
     
-    Automatically scrolls to latest message and handles message submission.
+    Runs as a fragment, so submitting a message reruns only the chat; the
+    full app reruns only when the message changed the dashboard.
     """
     # Use a container with fixed height for the chat history
     chat_container = st.container(height=500)
@@ -76,6 +176,7 @@ def render_chat_interface() -> None:
         })
         
         # Process message and get response
+        dashboard_version = st.session_state.get("dashboard_version", 0)
         response = process_user_message(user_input)
         
         # Add assistant response
@@ -84,7 +185,10 @@ def render_chat_interface() -> None:
             "content": response
         })
         
-        st.rerun()
+        if st.session_state.get("dashboard_version", 0) != dashboard_version:
+            st.rerun()
+        else:
+            st.rerun(scope="fragment")
 
 
 def render_dashboard_area() -> None:
@@ -110,109 +214,10 @@ def render_main_layout() -> None:
     initialize_session_state()
     
     # Inject enhanced global styles
-    st.markdown(
-        """
-        <style>
-        /* Import Google Fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-        
-        /* Global styling */
-        * {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        }
-        
-        /* Hide Streamlit branding */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        
-        /* Main container */
-        .block-container {
-            padding-top: 0.5rem;
-            padding-bottom: 1rem;
-            max-width: 100%;
-        }
-        
-        /* Page background */
-        .main {
-            background-color: #f8f9fa;
-        }
-        
-        /* Column styling */
-        [data-testid="column"] {
-            background: white;
-            border-radius: 8px;
-            padding: 20px;
-            border: 1px solid #e5e7eb;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        }
-        
-        /* Section headers */
-        h3 {
-            font-weight: 600;
-            font-size: 12px;
-            color: #6b7280;
-            margin-bottom: 0.75rem;
-            margin-top: 0;
-            padding-bottom: 0.5rem;
-            border-bottom: none;
-            text-transform: uppercase;
-            letter-spacing: 0.8px;
-        }
-        
-        /* Button styling */
-        .stButton > button {
-            border-radius: 6px;
-            font-weight: 600;
-            font-size: 13px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border: none;
-            transition: all 0.2s;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
-        }
-        
-        /* Chat container adjustments */
-        [data-testid="stVerticalBlock"] > [style*="height: 500px"] {
-            border-radius: 6px;
-            border: 1px solid #e5e7eb;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(GLOBAL_STYLE_HTML, unsafe_allow_html=True)
     
     # Minimal clean business header
-    st.markdown(
-        """
-        <div style="
-            background: white;
-            padding: 12px 0;
-            border-bottom: 2px solid #f1f5f9;
-            margin-bottom: 1.25rem;
-        ">
-            <span style="
-                color: #1f2937;
-                font-size: 16px;
-                font-weight: 600;
-                letter-spacing: -0.01em;
-            ">Equipment Inventory Assistant</span>
-            <span style="
-                color: #cbd5e0;
-                font-size: 14px;
-                margin: 0 10px;
-            ">|</span>
-            <span style="
-                color: #64748b;
-                font-size: 11px;
-            ">Ask questions in natural language</span>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Create two-column layout with better proportions
     col1, col2 = st.columns([4.5, 7.5], gap="large")